@@ -1,29 +1,110 @@
-from typing import List, Optional, Tuple, Union
+import sys
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .utils import string_from_snake_to_camel_case
+
+try:
+    import orjson
+except ImportError:  # optional, only used by `dumps_fast`
+    orjson = None
+
+# Field names are a small fixed set, so every conversion after the first is a hit
+_camel = lru_cache(maxsize=256)(string_from_snake_to_camel_case)
+
+
+def _json_fields(
+    fields: Tuple[str, ...], camel_case_keys: bool
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Pair every attribute name with the key it is serialized under.
+    """
+
+    if not camel_case_keys:
+        return tuple((name, name) for name in fields)
+    return tuple((name, _camel(name)) for name in fields)
 
 
 class Position:
     """
     Contains the cursor position (line and column) in the source code.
+
+    Positions are immutable: `Location.start` and `Location.end` build a new one on
+    every access, so changing it could not change the location. Assign a new
+    `Position` to `start`/`end`, or set `Location.start_line` and the like instead.
     """
 
+    __slots__ = ("line", "column")
+    _fields = __slots__
+    _json_fields_camel = _json_fields(_fields, True)
+    _json_fields_snake = _json_fields(_fields, False)
+
     def __init__(self, line: int, col: int) -> None:
-        self.line: int = line
-        self.column: int = col
+        object.__setattr__(self, "line", line)
+        object.__setattr__(self, "column", col)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Position is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Position is immutable, cannot delete {name!r}")
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return Position, (self.line, self.column)
 
 
 class Location:
     """
     Contains the location (start line/column & end line/column) of a node in the source code.
 
+    The four numbers are stored directly on the location (`start_line`,
+    `start_column`, `end_line`, `end_column`); `start` and `end` build an immutable
+    `Position` on access and can be assigned a new one.
+
     Attributes:
     ----------
     start: Position - The line and column of the start of the node
     end: Position - The line and column of the end of the node
     """
 
+    __slots__ = ("start_line", "start_column", "end_line", "end_column")
+    _fields = ("start", "end")
+    _json_fields_camel = _json_fields(_fields, True)
+    _json_fields_snake = _json_fields(_fields, False)
+
     def __init__(self, start: Tuple[int, int], end: Tuple[int, int]) -> None:
-        self.start: Position = Position(start[0], start[1])
-        self.end: Position = Position(end[0], end[1])
+        self.start_line, self.start_column = start
+        self.end_line, self.end_column = end
+
+    @property
+    def start(self) -> Position:
+        return Position(self.start_line, self.start_column)
+
+    @start.setter
+    def start(self, start: Position) -> None:
+        self.start_line, self.start_column = start.line, start.column
+
+    @property
+    def end(self) -> Position:
+        return Position(self.end_line, self.end_column)
+
+    @end.setter
+    def end(self, end: Position) -> None:
+        self.end_line, self.end_column = end.line, end.column
+
+    def to_json(self, camel_case_keys: bool = True) -> Dict[str, Any]:
+        # None of the keys has an underscore, so both key styles are the same
+        return {
+            "start": {"line": self.start_line, "column": self.start_column},
+            "end": {"line": self.end_line, "column": self.end_column},
+        }
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return Location, (
+            (self.start_line, self.start_column),
+            (self.end_line, self.end_column),
+        )
 
 
 class Range:
@@ -36,15 +117,57 @@ class Range:
     offset_end: int - The offset of the end of the node
     """
 
+    __slots__ = ("_packed",)
+    _fields = ("offset_start", "offset_end")
+    _json_fields_camel = _json_fields(_fields, True)
+    _json_fields_snake = _json_fields(_fields, False)
+
     def __init__(self, offset_start: int, offset_end: int) -> None:
-        self.offset_start: int = offset_start
-        self.offset_end: int = offset_end
+        # Both offsets share one int: the start in the high bits and the end as a
+        # signed 32-bit value in the low bits (the end is -1 for an empty source)
+        self._packed: int = (offset_start << 32) | (offset_end & 0xFFFFFFFF)
+
+    @property
+    def offset_start(self) -> int:
+        return self._packed >> 32
+
+    @offset_start.setter
+    def offset_start(self, offset_start: int) -> None:
+        self._packed = (offset_start << 32) | (self._packed & 0xFFFFFFFF)
+
+    @property
+    def offset_end(self) -> int:
+        offset_end = self._packed & 0xFFFFFFFF
+        return offset_end - 0x100000000 if offset_end & 0x80000000 else offset_end
+
+    @offset_end.setter
+    def offset_end(self, offset_end: int) -> None:
+        self._packed = (self._packed >> 32 << 32) | (offset_end & 0xFFFFFFFF)
+
+    def to_json(self, camel_case_keys: bool = True) -> Dict[str, Any]:
+        if camel_case_keys:
+            return {"offsetStart": self.offset_start, "offsetEnd": self.offset_end}
+        return {"offset_start": self.offset_start, "offset_end": self.offset_end}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return Range, (self.offset_start, self.offset_end)
+
+
+# Node classes by name, filled in by `BaseASTNode.__init_subclass__`.
+_node_classes: Dict[str, type] = {}
 
 
 class BaseASTNode:
     """
     Base class for all AST nodes. Contains base information that all nodes have.
 
+    Nodes use `__slots__` instead of an instance `__dict__`. Every subclass declares
+    its own fields in `__slots__`; `_fields` holds the full attribute order of the
+    class (`type`, the subclass fields, then `loc` and `range`), and
+    `_json_fields_camel`/`_json_fields_snake` pair each field with its JSON key.
+    `type` is a class attribute holding the interned class name, so nodes neither
+    store it nor need a custom `__new__` to set it.
+
     Attributes:
     ----------
     type: str - The string representation of a type of the node
@@ -53,30 +176,460 @@ class BaseASTNode:
     children: List[BaseASTNode] - The list of children nodes of the node
     """
 
-    def __init__(
-        self, type: str = None, range: Range = None, loc: Optional[Location] = None
-    ) -> None:
-        self.type: str = type if type else self.type
+    __slots__ = ("loc", "range")
+    _fields = ("type",) + __slots__
+    _json_fields_camel = _json_fields(_fields, True)
+    _json_fields_snake = _json_fields(_fields, False)
+    type = "BaseASTNode"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        own_fields = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            if klass is not BaseASTNode
+            for name in klass.__dict__.get("__slots__", ())
+        )
+        cls._fields = ("type",) + own_fields + ("loc", "range")
+        cls._json_fields_camel = _json_fields(cls._fields, True)
+        cls._json_fields_snake = _json_fields(cls._fields, False)
+        cls.type = sys.intern(cls.__name__)
+        _node_classes[cls.__name__] = cls
+
+    def __init__(self, range: Range = None, loc: Optional[Location] = None) -> None:
         self.loc: Location = loc
         self.range: Range = range
 
-    def __new__(cls, *args, **kwargs) -> "BaseASTNode":
-        o = object.__new__(cls)
-        setattr(o, "type", cls.__name__)
-        return o
-
     def add_loc(self, loc: Location) -> None:
         self.loc = loc
 
     def add_range(self, range: Range) -> None:
         self.range = range
 
+    def to_json(self, camel_case_keys: bool = True) -> Dict[str, Any]:
+        """
+        Convert the node and its whole subtree into JSON-compatible dicts and lists.
+
+        The tree is walked with an explicit stack rather than recursion, so deep
+        ASTs do not hit the interpreter recursion limit.
+
+        Parameters
+        ----------
+        camel_case_keys : bool - Whether to convert the attribute names to camelCase.
+
+        Returns
+        -------
+        Dict[str, Any] - The JSON representation of the node.
+        """
+
+        return _to_json(self, camel_case_keys)
+
+
+# How `_to_json` serializes a value, by its exact type, see `_json_kind`.
+# `_JSON_LEAF` objects (`Location`, `Range`) build their dict with their own `to_json`
+_JSON_SCALAR, _JSON_ARRAY, _JSON_OBJECT, _JSON_LEAF = range(4)
+_json_kinds: Dict[type, int] = {
+    type(None): _JSON_SCALAR,
+    str: _JSON_SCALAR,
+    bool: _JSON_SCALAR,
+    int: _JSON_SCALAR,
+    float: _JSON_SCALAR,
+    list: _JSON_ARRAY,
+    tuple: _JSON_ARRAY,
+}
+
+
+def _json_kind(value_type: type) -> int:
+    """
+    Classify a type not yet in `_json_kinds` (node classes, subclasses of builtins)
+    and remember the result.
+    """
+
+    if issubclass(value_type, (str, int, float)):
+        kind = _JSON_SCALAR
+    elif issubclass(value_type, (list, tuple)):
+        kind = _JSON_ARRAY
+    elif value_type is Location or value_type is Range:
+        kind = _JSON_LEAF
+    else:
+        kind = _JSON_OBJECT
+    _json_kinds[value_type] = kind
+    return kind
+
+
+def _to_json(obj: Any, camel_case_keys: bool) -> Dict[str, Any]:
+    """
+    Convert `obj` (a node, `Location`, `Range`, ...) and everything it holds into
+    JSON-compatible dicts and lists. See `BaseASTNode.to_json`.
+    """
+
+    fields_attr = "_json_fields_camel" if camel_case_keys else "_json_fields_snake"
+    # The loop below runs once per node and once per field, so everything it
+    # touches is bound to a local and every value is dispatched on its exact type
+    # with a single dict lookup.
+    kinds = _json_kinds
+    unset = UNSET
+    res = {}
+    stack = [(obj, res)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        obj, out = pop()
+        if isinstance(out, list):
+            append = out.append
+            for value in obj:
+                kind = kinds.get(type(value))
+                if kind is None:
+                    kind = _json_kind(type(value))
+                if kind == _JSON_SCALAR:
+                    append(value)
+                elif kind == _JSON_OBJECT:
+                    append(child := {})
+                    push((value, child))
+                elif kind == _JSON_ARRAY:
+                    append(child := [])
+                    push((value, child))
+                else:
+                    append(value.to_json(camel_case_keys))
+            continue
+        json_fields = getattr(obj, fields_attr, None)
+        if json_fields is None:
+            json_fields = _json_fields(
+                getattr(obj, "_fields", None) or tuple(vars(obj)), camel_case_keys
+            )
+        for name, key in json_fields:
+            value = getattr(obj, name, unset)
+            if value is unset:
+                continue
+            kind = kinds.get(type(value))
+            if kind is None:
+                kind = _json_kind(type(value))
+            if kind == _JSON_SCALAR:
+                out[key] = value
+            elif kind == _JSON_OBJECT:
+                out[key] = child = {}
+                push((value, child))
+            elif kind == _JSON_ARRAY:
+                out[key] = child = []
+                push((value, child))
+            else:
+                out[key] = value.to_json(camel_case_keys)
+    return res
+
+
+# Encoded `"key": ` prefixes per class, see `_json_key_prefixes`.
+_json_key_prefixes_cache: Dict[Tuple[type, bool], Tuple[Tuple[str, str], ...]] = {}
+
+
+def _json_key_prefixes(obj: Any, camel_case_keys: bool) -> Tuple[Tuple[str, str], ...]:
+    """
+    Pair every field of `obj` with its already encoded `"key": ` prefix.
+    """
+
+    cls = type(obj)
+    try:
+        return _json_key_prefixes_cache[cls, camel_case_keys]
+    except KeyError:
+        pass
+
+    fields_attr = "_json_fields_camel" if camel_case_keys else "_json_fields_snake"
+    json_fields = getattr(cls, fields_attr, None)
+    if json_fields is None:
+        fields = getattr(cls, "_fields", None)
+        if fields is None:
+            # No declared fields, so the keys depend on the instance
+            return tuple(
+                (name, encode_basestring_ascii(key) + ": ")
+                for name, key in _json_fields(tuple(vars(obj)), camel_case_keys)
+            )
+        json_fields = _json_fields(fields, camel_case_keys)
+    res = tuple(
+        (name, encode_basestring_ascii(key) + ": ") for name, key in json_fields
+    )
+    _json_key_prefixes_cache[cls, camel_case_keys] = res
+    return res
+
+
+_LOCATION_JSON = (
+    '{"start": {"line": %d, "column": %d}, "end": {"line": %d, "column": %d}}'
+)
+_RANGE_JSON_CAMEL = '{"offsetStart": %d, "offsetEnd": %d}'
+_RANGE_JSON_SNAKE = '{"offset_start": %d, "offset_end": %d}'
+
+
+def dumps(obj: Any, camel_case_keys: bool = True) -> str:
+    """
+    Serialize a node and its whole subtree straight into a JSON string.
+
+    The result is the same as `simplejson.dumps(obj.to_json(camel_case_keys))`, but
+    the text is written while walking the tree instead of first building the
+    intermediate dicts and walking those again.
+
+    Parameters
+    ----------
+    obj : Any - The node (or `Location`, `Range`, list of nodes, dict, ...) to
+        serialize.
+    camel_case_keys : bool - Whether to convert the attribute names to camelCase.
+
+    Returns
+    -------
+    str - The JSON representation of the node.
+    """
+
+    unset = UNSET
+    encode = encode_basestring_ascii
+    encode_scalar = _encode_scalar
+    key_prefixes_cache = _json_key_prefixes_cache
+    range_json = _RANGE_JSON_CAMEL if camel_case_keys else _RANGE_JSON_SNAKE
+    parts = []
+    write = parts.append
+    # Holds finished JSON text (str) and objects still to be written, in reverse
+    text = encode_scalar(obj, range_json)
+    stack = [obj if text is None else text]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        obj = pop()
+        obj_type = type(obj)
+        if obj_type is str:
+            write(obj)
+            continue
+        pieces = []
+        if obj_type is list or obj_type is tuple:
+            separator = "["
+            for value in obj:
+                pieces.append(separator)
+                separator = ", "
+                text = encode_scalar(value, range_json)
+                pieces.append(value if text is None else text)
+            pieces.append("]" if separator == ", " else "[]")
+        elif obj_type is dict:
+            # Plain dicts, such as a `to_json` result; written as they are
+            separator = "{"
+            for key, value in obj.items():
+                pieces.append(separator + encode(key) + ": ")
+                separator = ", "
+                text = encode_scalar(value, range_json)
+                pieces.append(value if text is None else text)
+            pieces.append("}" if separator == ", " else "{}")
+        else:
+            key_prefixes = key_prefixes_cache.get((obj_type, camel_case_keys))
+            if key_prefixes is None:
+                # Scalars only get here when they are the root or not of an
+                # exact builtin type, so they are kept off the common path
+                if isinstance(obj, str):
+                    write(encode(obj))
+                    continue
+                if obj is None or isinstance(obj, (int, float)):
+                    write(_json_scalar(obj))
+                    continue
+                key_prefixes = _json_key_prefixes(obj, camel_case_keys)
+            separator = "{"
+            for name, key_prefix in key_prefixes:
+                value = getattr(obj, name, unset)
+                if value is unset:
+                    continue
+                pieces.append(separator + key_prefix)
+                separator = ", "
+                text = encode_scalar(value, range_json)
+                pieces.append(value if text is None else text)
+            pieces.append("}" if separator == ", " else "{}")
+        pieces.reverse()
+        extend(pieces)
+    return "".join(parts)
+
+
+def _encode_scalar(value: Any, range_json: str) -> Optional[str]:
+    """
+    The JSON text of a value of an exact scalar type, `Location` or `Range`, or
+    None for anything `dumps` has to walk into.
+
+    `dumps` encodes every value it does not walk through here, so a scalar type
+    is handled the same at the root, in sequences and in objects.
+    """
+
+    value_type = type(value)
+    if value_type is str:
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value_type is int or value_type is float:
+        return repr(value)
+    if value_type is Location:
+        return _LOCATION_JSON % (
+            value.start_line,
+            value.start_column,
+            value.end_line,
+            value.end_column,
+        )
+    if value_type is Range:
+        return range_json % (value.offset_start, value.offset_end)
+    return None
+
+
+def _json_scalar(value: Union[None, bool, int, float]) -> str:
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return repr(value)
+
+
+def dumps_fast(obj: Any, camel_case_keys: bool = True) -> bytes:
+    """
+    Serialize a node and its whole subtree into JSON bytes with `orjson`.
+
+    orjson walks the tree in C and calls back into Python only to list the fields
+    of each AST object, through a reader generated once per class. The readers are
+    built with `exec` (see `_orjson_dumper`) so each is straight-line attribute
+    reads, and are cached in `_orjson_dumpers_camel`/`_orjson_dumpers_snake`; the
+    generated code only names fields from the `_fields` of the class definitions,
+    never data from the parsed source. Unlike `dumps`, the output has no spaces
+    after separators. Without orjson installed, and for trees nested deeper than
+    orjson's limit of 255 levels (a long chain of binary operations is enough),
+    this falls back to `dumps` encoded as UTF-8.
+
+    Parameters
+    ----------
+    obj : Any - The node (or `Location`, `Range`, list of nodes, ...) to serialize.
+    camel_case_keys : bool - Whether to convert the attribute names to camelCase.
+
+    Returns
+    -------
+    bytes - The JSON representation of the node.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=_orjson_default_camel
+                if camel_case_keys
+                else _orjson_default_snake,
+            )
+        except orjson.JSONEncodeError:
+            # Most likely the nesting limit; `dumps` walks with an explicit stack
+            pass
+    return dumps(obj, camel_case_keys).encode()
+
+
+# Field readers generated by `_orjson_dumper`, by class, for each key style
+_orjson_dumpers_camel: Dict[type, Any] = {}
+_orjson_dumpers_snake: Dict[type, Any] = {}
+
+
+def _orjson_default(obj: Any, camel_case_keys: bool) -> Dict[str, Any]:
+    cls = type(obj)
+    dumpers = _orjson_dumpers_camel if camel_case_keys else _orjson_dumpers_snake
+    if cls is Location or cls is Range:
+        dumper = dumpers[cls] = cls.to_json if camel_case_keys else _to_json_snake
+        return dumper(obj)
+    fields = getattr(cls, "_fields", None)
+    if fields is not None:
+        dumper = dumpers[cls] = _orjson_dumper(_json_fields(fields, camel_case_keys))
+        return dumper(obj)
+    # Without `_fields` the attributes may differ between instances
+    return {
+        key: getattr(obj, name)
+        for name, key in _json_fields(tuple(vars(obj)), camel_case_keys)
+    }
+
+
+def _to_json_snake(obj: Union[Location, Range]) -> Dict[str, Any]:
+    return obj.to_json(False)
+
+
+def _orjson_dumper(json_fields: Tuple[Tuple[str, str], ...]) -> Any:
+    """
+    Generate a function that reads the given fields of an object into a dict, with
+    one straight-line attribute read per field instead of a loop over the names.
+    Unset slots raise AttributeError and are left out, like `UNSET` elsewhere.
+    """
+
+    lines = ["def dump(obj):", "    res = {}"]
+    for name, key in json_fields:
+        lines += [
+            "    try:",
+            f"        res[{key!r}] = obj.{name}",
+            "    except AttributeError:",
+            "        pass",
+        ]
+    lines.append("    return res")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["dump"]
+
+
+def _orjson_default_camel(obj: Any) -> Dict[str, Any]:
+    dumper = _orjson_dumpers_camel.get(type(obj))
+    if dumper is None:
+        return _orjson_default(obj, True)
+    return dumper(obj)
+
+
+def _orjson_default_snake(obj: Any) -> Dict[str, Any]:
+    dumper = _orjson_dumpers_snake.get(type(obj))
+    if dumper is None:
+        return _orjson_default(obj, False)
+    return dumper(obj)
+
+
+def node_vars(obj: Union[BaseASTNode, Location, Position, Range]) -> Dict[str, Any]:
+    """
+    Slotted counterpart of `vars()` for AST objects.
+
+    Parameters
+    ----------
+    obj : Union[BaseASTNode, Location, Position, Range] - The object to inspect.
+
+    Returns
+    -------
+    Dict[str, Any] - The attributes that are set on the object, in `_fields` order.
+    """
+
+    fields = getattr(obj, "_fields", None)
+    if fields is None:
+        return dict(vars(obj))
+
+    res = {}
+    for name in fields:
+        value = getattr(obj, name, UNSET)
+        if value is not UNSET:
+            res[name] = value
+    return res
+
+
+class _Unset:
+    """
+    Marks a field that is not set on a node (e.g. `loc` when locations are disabled).
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "UNSET"
+
+    def __reduce__(self) -> str:
+        return "UNSET"
+
+
+UNSET = _Unset()
+
 
 class SourceUnit(BaseASTNode):
     """
     A root node of the AST. Contains all the nodes in the source code. Basically is a parsed compilation unit (a compound file).
     """
 
+    # `tokens` is only set when parsing with the `tokens` option
+    __slots__ = ("children", "errors", "tokens")
+
     def __init__(self, children: List[BaseASTNode]) -> None:
         self.children = children
         self.errors = []
@@ -87,6 +640,8 @@ class ContractDefinition(BaseASTNode):
     A node representing a contract definition.
     """
 
+    __slots__ = ("name", "base_contracts", "kind", "children")
+
     def __init__(
         self,
         name: str,
@@ -105,6 +660,8 @@ class InheritanceSpecifier(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("base_name", "arguments")
+
     def __init__(
         self, base_name: "UserDefinedTypeName", arguments: List["Expression"]
     ) -> None:
@@ -117,6 +674,8 @@ class UserDefinedTypeName(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name_path",)
+
     def __init__(self, name_path: str) -> None:
         self.name_path: str = name_path
 
@@ -126,6 +685,8 @@ class PragmaDirective(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "value")
+
     def __init__(self, name: str, value: str) -> None:
         self.name: str = name
         self.value: str = value
@@ -136,6 +697,15 @@ class ImportDirective(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = (
+        "path",
+        "path_literal",
+        "unit_alias",
+        "unit_alias_identifier",
+        "symbol_aliases",
+        "symbol_aliases_identifiers",
+    )
+
     def __init__(
         self,
         path: str,
@@ -162,6 +732,8 @@ class StateVariableDeclaration(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("variables", "initial_value")
+
     def __init__(
         self,
         variables: List["StateVariableDeclarationVariable"],
@@ -176,6 +748,14 @@ class FileLevelConstant(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = (
+        "type_name",
+        "name",
+        "initial_value",
+        "is_declared_const",
+        "is_immutable",
+    )
+
     def __init__(
         self,
         type_name: "TypeName",
@@ -196,6 +776,8 @@ class UsingForDeclaration(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("type_name", "functions", "operators", "library_name", "is_global")
+
     def __init__(
         self,
         type_name: Optional["TypeName"],
@@ -216,6 +798,8 @@ class StructDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "members")
+
     def __init__(self, name: str, members: List["VariableDeclaration"]) -> None:
         self.name: str = name
         self.members: List["VariableDeclaration"] = members
@@ -226,6 +810,8 @@ class ModifierDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "parameters", "is_virtual", "override", "body")
+
     def __init__(
         self,
         name: str,
@@ -246,6 +832,8 @@ class ModifierInvocation(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "arguments")
+
     def __init__(
         self, name: str, arguments: Optional[List["Expression"]] = None
     ) -> None:
@@ -258,6 +846,21 @@ class FunctionDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = (
+        "name",
+        "parameters",
+        "modifiers",
+        "state_mutability",
+        "visibility",
+        "return_parameters",
+        "body",
+        "override",
+        "is_constructor",
+        "is_receive_ether",
+        "is_fallback",
+        "is_virtual",
+    )
+
     def __init__(
         self,
         name: Optional[str],
@@ -294,6 +897,8 @@ class CustomErrorDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "parameters")
+
     def __init__(self, name: str, parameters: List["VariableDeclaration"]) -> None:
         self.name: str = name
         self.parameters: List["VariableDeclaration"] = parameters
@@ -304,6 +909,8 @@ class TypeDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "definition")
+
     def __init__(self, name: str, definition: "ElementaryTypeName") -> None:
         self.name: str = name
         self.definition: "ElementaryTypeName" = definition
@@ -314,6 +921,8 @@ class RevertStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("revert_call",)
+
     def __init__(self, revert_call: "FunctionCall") -> None:
         self.revert_call: "FunctionCall" = revert_call
 
@@ -323,8 +932,13 @@ class EventDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "parameters", "is_anonymous")
+
     def __init__(
-        self, name: str, parameters: List["VariableDeclaration"], is_anonymous: bool
+        self,
+        name: str,
+        parameters: List["VariableDeclaration"],
+        is_anonymous: bool,
     ) -> None:
         self.name: str = name
         self.parameters: List["VariableDeclaration"] = parameters
@@ -336,6 +950,8 @@ class EnumValue(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name: str = name
 
@@ -345,6 +961,8 @@ class EnumDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "members")
+
     def __init__(self, name: str, members: List[EnumValue]) -> None:
         self.name: str = name
         self.members: List[EnumValue] = members
@@ -355,6 +973,18 @@ class VariableDeclaration(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = (
+        "is_indexed",
+        "is_state_var",
+        "type_name",
+        "name",
+        "identifier",
+        "is_declared_const",
+        "storage_location",
+        "expression",
+        "visibility",
+    )
+
     def __init__(
         self,
         is_indexed: bool,
@@ -383,6 +1013,8 @@ class StateVariableDeclarationVariable(VariableDeclaration):
     #TODO: add docstring
     """
 
+    __slots__ = ("is_immutable", "override")
+
     def __init__(
         self,
         is_immutable: bool,
@@ -399,6 +1031,8 @@ class ArrayTypeName(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("base_type_name", "length")
+
     def __init__(
         self, base_type_name: "TypeName", length: Optional["Expression"] = None
     ) -> None:
@@ -411,6 +1045,8 @@ class Mapping(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("key_type", "key_name", "value_type", "value_name")
+
     def __init__(
         self,
         key_type: Union["ElementaryTypeName", "UserDefinedTypeName"],
@@ -429,6 +1065,8 @@ class FunctionTypeName(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("parameter_types", "return_types", "visibility", "state_mutability")
+
     def __init__(
         self,
         parameter_types: List["VariableDeclaration"],
@@ -447,6 +1085,8 @@ class Block(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("statements",)
+
     def __init__(self, statements: List[BaseASTNode]) -> None:
         self.statements: List[BaseASTNode] = statements
 
@@ -456,6 +1096,8 @@ class ExpressionStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("expression",)
+
     def __init__(self, expression: Optional["Expression"] = None) -> None:
         self.expression: Optional["Expression"] = expression
 
@@ -465,6 +1107,8 @@ class IfStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("condition", "true_body", "false_body")
+
     def __init__(
         self,
         condition: "Expression",
@@ -481,6 +1125,8 @@ class UncheckedStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("block",)
+
     def __init__(self, block: "Block") -> None:
         self.block: "Block" = block
 
@@ -490,6 +1136,8 @@ class TryStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("expression", "return_parameters", "body", "catch_clauses")
+
     def __init__(
         self,
         expression: "Expression",
@@ -510,6 +1158,8 @@ class CatchClause(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("is_reason_string_type", "kind", "parameters", "body")
+
     def __init__(
         self,
         is_reason_string_type: bool,
@@ -528,6 +1178,8 @@ class WhileStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: "Expression", body: "Statement") -> None:
         self.condition: "Expression" = condition
         self.body: "Statement" = body
@@ -538,6 +1190,8 @@ class ForStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("init_expression", "condition_expression", "loop_expression", "body")
+
     def __init__(
         self,
         init_expression: Optional["SimpleStatement"] = None,
@@ -556,6 +1210,8 @@ class InlineAssemblyStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("language", "flags", "body")
+
     def __init__(
         self,
         language: Optional[str] = None,
@@ -572,6 +1228,8 @@ class DoWhileStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: "Expression", body: "Statement") -> None:
         self.condition: "Expression" = condition
         self.body: "Statement" = body
@@ -582,6 +1240,8 @@ class ContinueStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -591,6 +1251,8 @@ class Break(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -600,6 +1262,8 @@ class Continue(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -609,6 +1273,8 @@ class BreakStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -618,6 +1284,8 @@ class ReturnStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("expression",)
+
     def __init__(self, expression: Optional["Expression"] = None) -> None:
         self.expression: Optional["Expression"] = expression
 
@@ -627,6 +1295,8 @@ class EmitStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("event_call",)
+
     def __init__(self, event_call: "FunctionCall") -> None:
         self.event_call: "FunctionCall" = event_call
 
@@ -636,6 +1306,8 @@ class ThrowStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -645,6 +1317,8 @@ class VariableDeclarationStatement(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("variables", "initial_value")
+
     def __init__(
         self,
         variables: List[Union[BaseASTNode, None]],
@@ -659,6 +1333,8 @@ class ElementaryTypeName(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "state_mutability")
+
     def __init__(self, name: str, state_mutability: Optional[str] = None) -> None:
         self.name: str = name
         self.state_mutability: Optional[str] = state_mutability  # TODO: make enum
@@ -669,6 +1345,8 @@ class FunctionCall(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("expression", "arguments", "names", "identifiers")
+
     def __init__(
         self,
         expression: "Expression",
@@ -687,6 +1365,8 @@ class AssemblyBlock(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("operations",)
+
     def __init__(self, operations: List["AssemblyItem"]) -> None:
         self.operations: List["AssemblyItem"] = operations
 
@@ -696,6 +1376,8 @@ class AssemblyCall(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("function_name", "arguments")
+
     def __init__(
         self, function_name: str, arguments: List["AssemblyExpression"]
     ) -> None:
@@ -708,6 +1390,8 @@ class AssemblyLocalDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("names", "expression")
+
     def __init__(
         self,
         names: Union[List["Identifier"], List["AssemblyMemberAccess"]],
@@ -722,6 +1406,8 @@ class AssemblyAssignment(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("names", "expression")
+
     def __init__(
         self,
         names: Union[List["Identifier"], List["AssemblyMemberAccess"]],
@@ -736,6 +1422,8 @@ class AssemblyStackAssignment(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "expression")
+
     def __init__(self, name: str, expression: "AssemblyExpression") -> None:
         self.name: str = name
         self.expression: "AssemblyExpression" = expression
@@ -746,6 +1434,8 @@ class LabelDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name: str = name
 
@@ -755,6 +1445,8 @@ class AssemblySwitch(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("expression", "cases")
+
     def __init__(
         self, expression: "AssemblyExpression", cases: List["AssemblyCase"]
     ) -> None:
@@ -767,6 +1459,8 @@ class AssemblyCase(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("value", "block", "default")
+
     def __init__(
         self, value: Optional["AssemblyLiteral"], block: "AssemblyBlock", default: bool
     ) -> None:
@@ -780,6 +1474,8 @@ class AssemblyFunctionDefinition(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name", "arguments", "return_arguments", "body")
+
     def __init__(
         self,
         name: str,
@@ -798,6 +1494,8 @@ class AssemblyFor(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("pre", "condition", "post", "body")
+
     def __init__(
         self,
         pre: Union["AssemblyBlock", "AssemblyExpression"],
@@ -816,6 +1514,8 @@ class AssemblyIf(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition: "AssemblyExpression", body: "AssemblyBlock") -> None:
         self.condition: "AssemblyExpression" = condition
         self.body: "AssemblyBlock" = body
@@ -827,6 +1527,8 @@ class AssemblyLiteral(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -836,6 +1538,8 @@ class AssemblyMemberAccess(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("expression", "member_name")
+
     def __init__(self, expression: "Identifier", member_name: "Identifier") -> None:
         self.expression: "Identifier" = expression
         self.member_name: "Identifier" = member_name
@@ -846,6 +1550,8 @@ class NewExpression(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("type_name",)
+
     def __init__(self, type_name: "TypeName") -> None:
         self.type_name: "TypeName" = type_name
 
@@ -855,6 +1561,8 @@ class TupleExpression(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("components", "is_array")
+
     def __init__(
         self, components: List[Union[BaseASTNode, None]], isArray: bool
     ) -> None:
@@ -867,6 +1575,8 @@ class NameValueExpression(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("expression", "arguments")
+
     def __init__(self, expression: "Expression", arguments: "NameValueList") -> None:
         self.expression: "Expression" = expression
         self.arguments: "NameValueList" = arguments
@@ -877,6 +1587,8 @@ class NumberLiteral(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("number", "subdenomination")
+
     def __init__(self, number: str, subdenomination: Optional[str] = None) -> None:
         self.number: str = number
         self.subdenomination: Optional[str] = subdenomination
@@ -887,6 +1599,8 @@ class BooleanLiteral(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: bool) -> None:
         self.value: bool = value
 
@@ -896,6 +1610,8 @@ class HexLiteral(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("value", "parts")
+
     def __init__(self, value: str, parts: List[str]) -> None:
         self.value: str = value
         self.parts: List[str] = parts
@@ -906,6 +1622,8 @@ class StringLiteral(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("value", "parts", "is_unicode")
+
     def __init__(self, value: str, parts: List[str], is_unicode: List[bool]) -> None:
         self.value: str = value
         self.parts: List[str] = parts
@@ -917,46 +1635,50 @@ class Identifier(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name: str = name
 
 
 # TODO: convert to enum
-BINARY_OP_VALUES = (
-    "+",
-    "-",
-    "*",
-    "/",
-    "**",
-    "%",
-    "<<",
-    ">>",
-    "&&",
-    "||",
-    "&",
-    "^",
-    "<",
-    ">",
-    "<=",
-    ">=",
-    "==",
-    "!=",
-    "=",
-    "^=",
-    "&=",
-    "<<=",
-    ">>=",
-    "+=",
-    "-=",
-    "*=",
-    "/=",
-    "%=",
-    "|",
-    "|=",
+BINARY_OP_VALUES = frozenset(
+    {
+        "+",
+        "-",
+        "*",
+        "/",
+        "**",
+        "%",
+        "<<",
+        ">>",
+        "&&",
+        "||",
+        "&",
+        "^",
+        "<",
+        ">",
+        "<=",
+        ">=",
+        "==",
+        "!=",
+        "=",
+        "^=",
+        "&=",
+        "<<=",
+        ">>=",
+        "+=",
+        "-=",
+        "*=",
+        "/=",
+        "%=",
+        "|",
+        "|=",
+    }
 )
 
 # TODO: convert to enum
-UNARY_OP_VALUES = ("-", "+", "++", "--", "~", "after", "delete", "!")
+UNARY_OP_VALUES = frozenset({"-", "+", "++", "--", "~", "after", "delete", "!"})
 
 
 class BinaryOperation(BaseASTNode):
@@ -964,6 +1686,8 @@ class BinaryOperation(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("left", "right", "operator")
+
     def __init__(self, left: "Expression", right: "Expression", operator: str) -> None:
         self.left: "Expression" = left
         self.right: "Expression" = right
@@ -975,6 +1699,8 @@ class UnaryOperation(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("operator", "sub_expression", "is_prefix")
+
     def __init__(
         self, operator: str, sub_expression: "Expression", is_prefix: bool
     ) -> None:
@@ -988,6 +1714,8 @@ class Conditional(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("condition", "true_expression", "false_expression")
+
     def __init__(
         self,
         condition: "Expression",
@@ -1004,6 +1732,8 @@ class IndexAccess(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("base", "index")
+
     def __init__(self, base: "Expression", index: "Expression") -> None:
         self.base: "Expression" = base
         self.index: "Expression" = index
@@ -1014,6 +1744,8 @@ class IndexRangeAccess(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("base", "index_start", "index_end")
+
     def __init__(
         self,
         base: "Expression",
@@ -1030,6 +1762,8 @@ class MemberAccess(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("expression", "member_name")
+
     def __init__(self, expression: "Expression", member_name: str) -> None:
         self.expression: "Expression" = expression
         self.member_name: str = member_name
@@ -1040,6 +1774,8 @@ class HexNumber(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str) -> None:
         self.value: str = value
 
@@ -1049,6 +1785,8 @@ class DecimalNumber(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str) -> None:
         self.value: str = value
 
@@ -1058,6 +1796,8 @@ class NameValueList(BaseASTNode):
     #TODO: add docstring
     """
 
+    __slots__ = ("names", "identifiers", "arguments")
+
     def __init__(
         self,
         names: List[str],
@@ -1074,7 +1814,7 @@ class ASTNode:
     #TODO: add docstring
     """
 
-    pass
+    __slots__ = ()
 
 
 # TODO: make enum
@@ -1083,7 +1823,7 @@ class AssemblyItem(ASTNode):
     #TODO: add docstring
     """
 
-    pass
+    __slots__ = ()
 
 
 # TODO: make enum
@@ -1092,7 +1832,7 @@ class AssemblyExpression(AssemblyItem):
     #TODO: add docstring
     """
 
-    pass
+    __slots__ = ()
 
 
 # TODO: make enum
@@ -1101,7 +1841,7 @@ class Expression(ASTNode):
     #TODO: add docstring
     """
 
-    pass
+    __slots__ = ()
 
 
 # TODO: make enum
@@ -1110,7 +1850,7 @@ class PrimaryExpression(Expression):
     #TODO: add docstring
     """
 
-    pass
+    __slots__ = ()
 
 
 # TODO: make enum
@@ -1119,7 +1859,7 @@ class Statement(ASTNode):
     #TODO: add docstring
     """
 
-    pass
+    __slots__ = ()
 
 
 # TODO: make enum
@@ -1128,7 +1868,7 @@ class SimpleStatement(Statement):
     #TODO: add docstring
     """
 
-    pass
+    __slots__ = ()
 
 
 # class TypeName:
@@ -1191,7 +1931,7 @@ class TypeName(ASTNode):
     #TODO: add docstring
     """
 
-    pass
+    __slots__ = ()
 
 
 # class UserDefinedTypeName(ASTNode):
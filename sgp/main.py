@@ -1,21 +1,22 @@
-import sgp_parser
+from . import sgp_parser
 
-
-def main():
-    input = """
+EXAMPLE = """
 // SPDX-License-Identifier: MIT
 pragma solidity ^0.8.17;
 
 contract X {
 
-    function a() public pure returns (uint) {        
+    function a() public pure returns (uint) {
         return 1;
     }
 
 }
     """
+
+
+def main():
     try:
-        ast = sgp_parser.parse(input, dump_json=True)
+        ast = sgp_parser.parse(EXAMPLE, dump_json=True)
         print(ast)
     except Exception as e:
         print(e)
@@ -4,6 +4,9 @@ from antlr4.error.ErrorListener import ErrorListener
 
 
 class SGPError:
+    __slots__ = ("message", "line", "column")
+    _fields = __slots__
+
     def __init__(self, message, line, column):
         self.message = message
         self.line = line
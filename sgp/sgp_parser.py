@@ -1,5 +1,7 @@
 import os
-import simplejson
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from antlr4.CommonTokenStream import CommonTokenStream
 from antlr4.InputStream import InputStream as ANTLRInputStream
@@ -7,11 +9,18 @@ from antlr4.InputStream import InputStream as ANTLRInputStream
 from .parser.SolidityLexer import SolidityLexer
 from .parser.SolidityParser import SolidityParser
 
-from .sgp_visitor import SGPVisitorOptions, SGPVisitor
+from .sgp_visitor import SGPVisitorOptions, SGPVisitor, UnrecognizedExpressionError
 from .sgp_error_listener import SGPErrorListener
-from .ast_node_types import SourceUnit
+from .ast_node_types import (
+    Location,
+    Position,
+    Range,
+    SourceUnit,
+    _node_classes,
+    dumps,
+    dumps_fast,
+)
 from .tokens import build_token_list
-from .utils import string_from_snake_to_camel_case
 
 
 class ParserError(Exception):
@@ -31,73 +40,316 @@ class ParserError(Exception):
         self.errors = errors
 
 
-def parse(
-    input_string: str,
-    options: SGPVisitorOptions = SGPVisitorOptions(),
-    dump_json: bool = False,
-    dump_path: str = "./out",
+# Used when `parse` is called without options; never mutated
+_DEFAULT_OPTIONS = SGPVisitorOptions()
+
+
+def _options_key(options: SGPVisitorOptions) -> Tuple[bool, bool, bool, bool]:
+    return (options.tokens, options.errors_tolerant, options.range, options.loc)
+
+
+# Pickled ASTs of recent `parse(..., cache=True)` calls, least recently used first,
+# keyed by a digest of the input and the options
+_PARSE_CACHE_SIZE = 256
+_parse_cache: "OrderedDict[Tuple[bytes, Tuple[bool, bool, bool, bool]], bytes]" = (
+    OrderedDict()
+)
+_parse_cache_lock = threading.Lock()
+
+
+# Digest of the sgp version and of the fields of every AST class, part of each
+# on-disk entry's file name, so entries pickled by another release (whose visitor
+# may build other ASTs) or with other node shapes are never loaded. Computed by
+# the first disk cache lookup.
+_disk_cache_version: Optional[str] = None
+
+
+def _get_disk_cache_version() -> str:
+    global _disk_cache_version
+    if _disk_cache_version is None:
+        import hashlib
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            sgp_version = version("openzeppelin-solidity-grammar-parser")
+        except PackageNotFoundError:
+            # Running from a source tree: the visitor source stands in for the
+            # version, so editing it invalidates the entries it built
+            try:
+                with open(
+                    os.path.join(os.path.dirname(__file__), "sgp_visitor.py"), "rb"
+                ) as f:
+                    sgp_version = hashlib.blake2b(f.read()).hexdigest()
+            except OSError:
+                sgp_version = "unknown"
+        shapes = sorted(
+            (cls.__name__, cls._fields)
+            for cls in (Position, Location, Range, *_node_classes.values())
+        )
+        _disk_cache_version = hashlib.blake2b(
+            repr((sgp_version, shapes)).encode(), digest_size=8
+        ).hexdigest()
+    return _disk_cache_version
+
+
+def _parse_cached(
+    input_string: str, options: SGPVisitorOptions, cache_dir: Optional[str] = None
 ) -> SourceUnit:
-    """
-    Parse a Solidity source string into an AST.
+    # Only imported by the cache, so a plain parse does not pay for them at startup
+    import hashlib
+    import pickle
 
-    Parameters
-    ----------
-    input_string : str - The Solidity source string to parse.
-    options : SGPVisitorOptions - Options to pass to the parser.
-    dump_json : bool - Whether to dump the AST as a JSON file.
-    dump_path : str - The path to dump the AST JSON file to.
+    input_hash = hashlib.blake2b(input_string.encode(), digest_size=16).digest()
+    key = (input_hash, _options_key(options))
+    with _parse_cache_lock:
+        data = _parse_cache.get(key)
+        if data is not None:
+            _parse_cache.move_to_end(key)
 
-    Returns
-    -------
-    SourceUnit - The root of an AST of the Solidity source string.
+    if data is None:
+        path = _disk_cache_path(cache_dir, key) if cache_dir else None
+        data = _read_disk_cache(path) if path else None
+        if data is not None:
+            source_unit = _load_disk_cache(path, data)
+            if source_unit is None:
+                data = None
+        if data is None:
+            source_unit = _parse(input_string, options)
+            data = pickle.dumps(source_unit, pickle.HIGHEST_PROTOCOL)
+            if path:
+                _write_disk_cache(path, data)
+        with _parse_cache_lock:
+            _parse_cache[key] = data
+            if len(_parse_cache) > _PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+        # Nobody else holds this AST yet, so it can be returned without a copy
+        return source_unit
+
+    # Every call unpickles its own copy, so callers can mutate the result freely
+    return pickle.loads(data)
+
+
+def _disk_cache_path(
+    cache_dir: str, key: Tuple[bytes, Tuple[bool, bool, bool, bool]]
+) -> str:
+    input_hash, options_key = key
+    flags = "".join("1" if flag else "0" for flag in options_key)
+    file_name = f"{input_hash.hex()}-{flags}-{_get_disk_cache_version()}.pickle"
+    return os.path.join(os.path.expanduser(cache_dir), file_name)
+
+
+def _read_disk_cache(path: str) -> Optional[bytes]:
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _load_disk_cache(path: str, data: bytes) -> Optional[SourceUnit]:
+    # A truncated or otherwise unreadable entry is a miss; it is removed so the
+    # fresh parse can replace it
+    import pickle
+
+    try:
+        source_unit = pickle.loads(data)
+    except Exception:
+        source_unit = None
+    if not isinstance(source_unit, SourceUnit):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+    return source_unit
+
+
+def _write_disk_cache(path: str, data: bytes) -> None:
+    # The disk cache is best effort: a failed write only means a later miss.
+    # Entries are written to a temporary file first and renamed into place, so
+    # concurrent readers never see a partial entry.
+    import tempfile
+
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
+
+# Writes the dumps of `parse(..., dump_async=True)`, created by the first of them.
+# A single worker keeps the writes in submission order.
+_dump_pool = None
+# Futures of the writes `wait_for_dumps` has not collected yet
+_pending_dumps = []
+_dump_pool_lock = threading.Lock()
+
+
+def _get_dump_pool():
+    global _dump_pool
+    with _dump_pool_lock:
+        if _dump_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _dump_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="sgp-dump"
+            )
+        return _dump_pool
+
+
+def _dumps_bytes(obj) -> bytes:
+    # `dumps` escapes every non-ASCII character, so the text is plain ASCII
+    return dumps(obj).encode("ascii")
+
+
+def _write_dump(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _submit_dump(path: str, data: bytes) -> None:
+    pool = _get_dump_pool()
+    with _dump_pool_lock:
+        _pending_dumps.append(pool.submit(_write_dump, path, data))
+
+
+def wait_for_dumps() -> None:
     """
+    Block until every AST dump started by `parse(..., dump_async=True)` is written.
 
-    input_stream = ANTLRInputStream(input_string)
-    lexer = SolidityLexer(input_stream)
-    token_stream = CommonTokenStream(lexer)
-    parser = SolidityParser(token_stream)
+    Raises
+    ------
+    OSError - The first error a write failed with, once every write has finished.
+    """
 
-    listener = SGPErrorListener()
+    with _dump_pool_lock:
+        pending = _pending_dumps[:]
+        del _pending_dumps[:]
+    error = None
+    for future in pending:
+        exception = future.exception()
+        if exception is not None and error is None:
+            error = exception
+    if error is not None:
+        raise error
+
+
+def _make_lexer(
+    input_string: str, listener: Optional[SGPErrorListener] = None
+) -> SolidityLexer:
+    lexer = SolidityLexer(ANTLRInputStream(input_string))
     lexer.removeErrorListeners()
-    lexer.addErrorListener(listener)
+    if listener is not None:
+        lexer.addErrorListener(listener)
+    return lexer
 
+
+def _make_parser(
+    lexer: SolidityLexer, listener: SGPErrorListener
+) -> Tuple[CommonTokenStream, SolidityParser]:
+    token_stream = CommonTokenStream(lexer)
+    parser = SolidityParser(token_stream)
     parser.removeErrorListeners()
     parser.addErrorListener(listener)
+    return token_stream, parser
+
+
+def _parse(input_string: str, options: SGPVisitorOptions) -> SourceUnit:
+    listener = SGPErrorListener()
+    token_stream, parser = _make_parser(_make_lexer(input_string, listener), listener)
     source_unit = parser.sourceUnit()
 
     ast_builder = SGPVisitor(options)
     try:
         source_unit: SourceUnit = ast_builder.visit(source_unit)
-    except Exception:
-        raise Exception("AST was not generated")
+    except UnrecognizedExpressionError:
+        raise
+    except Exception as e:
+        raise Exception("AST was not generated") from e
     else:
         if source_unit is None:
             raise Exception("AST was not generated")
 
-    # TODO: sort it out
-    token_list = []
-    if options.tokens:
-        token_list = build_token_list(token_stream.getTokens(), options)
-
     if not options.errors_tolerant and listener.has_errors():
         raise ParserError(errors=listener.get_errors())
 
     if options.errors_tolerant and listener.has_errors():
         source_unit.errors = listener.get_errors()
 
-    # TODO: sort it out
     if options.tokens:
-        source_unit["tokens"] = token_list
+        # The parser has already buffered every token, so read them straight from
+        # the stream rather than through a copy
+        source_unit.tokens = list(build_token_list(token_stream.tokens, options))
+
+    return source_unit
+
+
+def parse(
+    input_string: str,
+    options: Optional[SGPVisitorOptions] = None,
+    dump_json: bool = False,
+    dump_path: str = "./out",
+    dump_async: bool = False,
+    cache: bool = False,
+    cache_dir: Optional[str] = None,
+    fast_json: bool = False,
+) -> SourceUnit:
+    """
+    Parse a Solidity source string into an AST.
+
+    Parameters
+    ----------
+    input_string : str - The Solidity source string to parse.
+    options : Optional[SGPVisitorOptions] - Options to pass to the parser. Defaults
+        to `SGPVisitorOptions()`.
+    dump_json : bool - Whether to dump the AST as a JSON file, written by `dumps`.
+    dump_path : str - The path to dump the AST JSON file to.
+    dump_async : bool - Whether to write the AST JSON file on a background thread.
+        The JSON is still built before `parse` returns, so the AST can be mutated
+        right away; call `wait_for_dumps` before reading the file, which also
+        raises the error of a failed write.
+    cache : bool - Whether to reuse the AST of a previous call with the same input
+        string and options. Each call gets its own copy of the cached AST, so the
+        result can be mutated freely.
+    cache_dir : Optional[str] - A directory to also keep the cached ASTs in, so they
+        are reused across processes. Only used together with `cache`. Defaults to
+        the `SGP_AST_CACHE` environment variable; without either, the cache lives
+        in memory only. Entries are pickles, and loading a pickle can run
+        arbitrary code, so the directory must only be writable by trusted users.
+    fast_json : bool - Whether to dump the AST with `dumps_fast` instead. It is
+        faster with orjson installed, but then the file has no spaces after
+        separators and non-ASCII text is written as UTF-8 rather than escaped.
+
+    Returns
+    -------
+    SourceUnit - The root of an AST of the Solidity source string.
+
+    Raises
+    ------
+    ParserError - The source has syntax errors and `errors_tolerant` is not set.
+    UnrecognizedExpressionError - The visitor met an expression it cannot build.
+    """
+
+    if options is None:
+        options = _DEFAULT_OPTIONS
+
+    if cache:
+        source_unit = _parse_cached(
+            input_string, options, cache_dir or os.environ.get("SGP_AST_CACHE")
+        )
+    else:
+        source_unit = _parse(input_string, options)
 
     if dump_json:
         os.makedirs(dump_path, exist_ok=True)
-        with open(os.path.join(dump_path, "ast.json"), "w") as f:
-            s = simplejson.dumps(
-                source_unit,
-                default=lambda obj: {
-                    string_from_snake_to_camel_case(k): v
-                    for k, v in obj.__dict__.items()
-                },
-            )
-            f.write(s)
+        path = os.path.join(dump_path, "ast.json")
+        # The default format does not depend on whether orjson is installed
+        data = dumps_fast(source_unit) if fast_json else _dumps_bytes(source_unit)
+        if dump_async:
+            _submit_dump(path, data)
+        else:
+            _write_dump(path, data)
     return source_unit
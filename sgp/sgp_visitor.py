@@ -1,7 +1,8 @@
-from typing import Any, List, Optional, Tuple, Union
+import sys
+from typing import Any, Iterator, List, Optional, Tuple, Union
 from typing_extensions import override
 
-from antlr4.tree.Tree import ErrorNode
+from antlr4.tree.Tree import ErrorNode, TerminalNode
 from antlr4 import ParserRuleContext
 from antlr4.tree.Tree import ParseTree
 from antlr4.error.Errors import RecognitionException
@@ -11,8 +12,92 @@ from .parser.SolidityVisitor import SolidityVisitor
 
 from .ast_node_types import *
 
+# Visibility keywords in the order they take precedence, see `_visibility`
+_FUNCTION_VISIBILITIES = (
+    (SP.ExternalKeyword, "external"),
+    (SP.InternalKeyword, "internal"),
+    (SP.PublicKeyword, "public"),
+    (SP.PrivateKeyword, "private"),
+)
+_CONSTRUCTOR_VISIBILITIES = (
+    (SP.InternalKeyword, "internal"),
+    (SP.PublicKeyword, "public"),
+)
+_STATE_VARIABLE_VISIBILITIES = (
+    (SP.InternalKeyword, "internal"),
+    (SP.PublicKeyword, "public"),
+    (SP.PrivateKeyword, "private"),
+)
+
+# A state mutability is a single keyword, see `_stateMutabilityToText`
+_STATE_MUTABILITIES = {
+    SP.PureKeyword: "pure",
+    SP.ConstantKeyword: "constant",
+    SP.PayableKeyword: "payable",
+    SP.ViewKeyword: "view",
+}
+
+# Context classes checked on every expression, literal or type name, bound once
+# here rather than looked up on `SP` per visit
+_PrimaryExpressionContext = SP.PrimaryExpressionContext
+_IdentifierContext = SP.IdentifierContext
+_NumberLiteralContext = SP.NumberLiteralContext
+_StringLiteralContext = SP.StringLiteralContext
+_HexLiteralContext = SP.HexLiteralContext
+_TypeNameContext = SP.TypeNameContext
+_ElementaryTypeNameContext = SP.ElementaryTypeNameContext
+_UserDefinedTypeNameContext = SP.UserDefinedTypeNameContext
+_MappingContext = SP.MappingContext
+_FunctionTypeNameContext = SP.FunctionTypeNameContext
+
+
+def _tree_text(tree: ParseTree) -> str:
+    """
+    The text of `tree`, the same as `tree.getText()`: the text of every token in
+    the subtree, joined. Terminals read their token directly and rule contexts
+    join their children without the `StringIO` and child generator of ANTLR's
+    `getText`.
+    """
+
+    if isinstance(tree, TerminalNode):
+        return tree.symbol.text
+    children = tree.children
+    if not children:
+        return ""
+    if len(children) == 1:
+        return _tree_text(children[0])
+    return "".join([_tree_text(child) for child in children])
+
+
+def _terminal_text(tree: ParseTree) -> Optional[str]:
+    """
+    The text of `tree` if it is a single token, otherwise `None`. Used to match
+    operators and brackets without joining the text of a whole subexpression.
+    """
+
+    return tree.symbol.text if isinstance(tree, TerminalNode) else None
+
+
+class UnrecognizedExpressionError(ValueError):
+    """
+    Raised by `SGPVisitor.visitExpression` for an expression context that matches
+    none of the expression forms it knows.
+    """
+
+    def __init__(self, ctx: ParserRuleContext) -> None:
+        """
+        Parameters
+        ----------
+        ctx : ParserRuleContext - The expression context that was not recognized.
+        """
+        # The source text is only joined here, once an error is actually raised
+        super().__init__(f"Unrecognized expression: {_tree_text(ctx)}")
+        self.ctx = ctx
+
 
 class SGPVisitorOptions:
+    __slots__ = ("range", "loc", "tokens", "errors_tolerant")
+
     def __init__(
         self,
         tokens: bool = False,
@@ -25,14 +110,14 @@ class SGPVisitorOptions:
 
         Parameters
         ----------
-        tokens : bool, optional, default False - #TODO: sort it out
+        tokens : bool, optional, default False - add the list of source tokens to the SourceUnit
         tolerant : bool, optional, default True - suppress not critical [CST](https://en.wikipedia.org/wiki/Parse_tree) traversing errors
         range : bool, optional, default True - add range (start, end offset) information to AST nodes
         loc : bool, optional, default True - add line/column location information to AST nodes
         """
         self.range: bool = range
         self.loc: bool = loc
-        self.tokens: bool = tokens  # TODO: sort it out
+        self.tokens: bool = tokens
         self.errors_tolerant: bool = tolerant
 
 
@@ -69,8 +154,10 @@ class SGPVisitor(SolidityVisitor):
             try:
                 n = self.visit(child)
                 parsed_children.append(n)
+            except UnrecognizedExpressionError:
+                raise
             except Exception as e:
-                raise RecognitionException(str(e), None, None, ctx)
+                raise RecognitionException(str(e), None, None, ctx) from e
 
         node = SourceUnit(children=parsed_children)
 
@@ -92,7 +179,7 @@ class SGPVisitor(SolidityVisitor):
             base_contracts=list(
                 map(self.visitInheritanceSpecifier, ctx.inheritanceSpecifier())
             ),
-            children=list(map(self.visit, ctx.contractPart())),
+            children=list(map(self.visitContractPart, ctx.contractPart())),
             kind=kind,
         )
 
@@ -108,31 +195,19 @@ class SGPVisitor(SolidityVisitor):
         if ctxExpression:
             expression = self.visitExpression(ctxExpression)
 
-        visibility = "default"
-        if len(ctx.InternalKeyword()) > 0:
-            visibility = "internal"
-        elif len(ctx.PublicKeyword()) > 0:
-            visibility = "public"
-        elif len(ctx.PrivateKeyword()) > 0:
-            visibility = "private"
+        visibility = self._visibility(ctx, _STATE_VARIABLE_VISIBILITIES)
 
-        isDeclaredConst = False
-        if len(ctx.ConstantKeyword()) > 0:
-            isDeclaredConst = True
+        isDeclaredConst = bool(ctx.ConstantKeyword())
 
         override = None
         overrideSpecifier = ctx.overrideSpecifier()
-        if len(overrideSpecifier) == 0:
-            override = None
-        else:
+        if overrideSpecifier:
             override = [
                 self.visitUserDefinedTypeName(x)
                 for x in overrideSpecifier[0].userDefinedTypeName()
             ]
 
-        isImmutable = False
-        if len(ctx.ImmutableKeyword()) > 0:
-            isImmutable = True
+        isImmutable = bool(ctx.ImmutableKeyword())
 
         decl = StateVariableDeclarationVariable(
             type_name=type,
@@ -212,29 +287,21 @@ class SGPVisitor(SolidityVisitor):
         return self.visit(ctx.getChild(0))  # Assuming the child type is SimpleStatement
 
     def visitEventDefinition(self, ctx: SP.EventDefinitionContext) -> EventDefinition:
-        parameters = [
-            self._add_meta(
-                VariableDeclaration(
-                    type_name=self.visitTypeName(paramCtx.typeName()),
-                    name=(
-                        self._to_text(paramCtx.identifier())
-                        if paramCtx.identifier()
-                        else None
-                    ),
-                    identifier=(
-                        self.visitIdentifier(paramCtx.identifier())
-                        if paramCtx.identifier()
-                        else None
-                    ),
-                    is_state_var=False,
-                    is_indexed=bool(paramCtx.IndexedKeyword() is not None),
-                    storage_location=None,
-                    expression=None,
+        parameters = []
+        for paramCtx in ctx.eventParameterList().eventParameter():
+            identifierCtx = paramCtx.identifier()
+            parameter = VariableDeclaration(
+                type_name=self.visitTypeName(paramCtx.typeName()),
+                name=self._to_text(identifierCtx) if identifierCtx else None,
+                identifier=(
+                    self.visitIdentifier(identifierCtx) if identifierCtx else None
                 ),
-                paramCtx,
+                is_state_var=False,
+                is_indexed=paramCtx.IndexedKeyword() is not None,
+                storage_location=None,
+                expression=None,
             )
-            for paramCtx in ctx.eventParameterList().eventParameter()
-        ]
+            parameters.append(self._add_meta(parameter, paramCtx))
 
         node = EventDefinition(
             name=self._to_text(ctx.identifier()),
@@ -255,21 +322,22 @@ class SGPVisitor(SolidityVisitor):
         return self._add_meta(node, ctx)
 
     def visitParameter(self, ctx: SP.ParameterContext) -> VariableDeclaration:
+        ctxStorageLocation = ctx.storageLocation()
         storageLocation = (
-            self._to_text(ctx.storageLocation()) if ctx.storageLocation() else None
+            self._to_text(ctxStorageLocation) if ctxStorageLocation else None
         )
-        name = self._to_text(ctx.identifier()) if ctx.identifier() else None
+        identifierCtx = ctx.identifier()
+        name = self._to_text(identifierCtx) if identifierCtx else None
 
+        ctxStateMutability = ctx.stateMutability()
         state_mutability = (
-            self._to_text(ctx.stateMutability()) if ctx.stateMutability() else None
+            self._to_text(ctxStateMutability) if ctxStateMutability else None
         )
 
         node = VariableDeclaration(
             type_name=self.visitTypeName(ctx.typeName()),
             name=name,
-            identifier=(
-                self.visitIdentifier(ctx.identifier()) if ctx.identifier() else None
-            ),
+            identifier=self.visitIdentifier(identifierCtx) if identifierCtx else None,
             storage_location=storageLocation,
             is_state_var=False,
             is_indexed=False,
@@ -298,32 +366,27 @@ class SGPVisitor(SolidityVisitor):
         if ctxBlock is not None:
             block = self.visitBlock(ctxBlock)
 
-        modifiers = [
-            self.visitModifierInvocation(mod)
-            for mod in ctx.modifierList().modifierInvocation()
-        ]
+        ctxModifierList = ctx.modifierList()
+        modifiers = list(
+            map(self.visitModifierInvocation, ctxModifierList.modifierInvocation())
+        )
 
         stateMutability = None
-        if ctx.modifierList().stateMutability():
-            stateMutability = self._stateMutabilityToText(
-                ctx.modifierList().stateMutability(0)
-            )
+        ctxStateMutability = ctxModifierList.stateMutability()
+        if ctxStateMutability:
+            stateMutability = self._stateMutabilityToText(ctxStateMutability[0])
 
         # see what type of function we"re dealing with
         ctxReturnParameters = ctx.returnParameters()
-        func_desc_child = self._to_text(ctx.functionDescriptor().getChild(0))
+        ctxFunctionDescriptor = ctx.functionDescriptor()
+        func_desc_child = self._to_text(ctxFunctionDescriptor.getChild(0))
         if func_desc_child == "constructor":
-            parameters = [self.visit(x) for x in ctx.parameterList().parameter()]
+            parameters = list(map(self.visitParameter, ctx.parameterList().parameter()))
             # error out on incorrect function visibility
-            if ctx.modifierList().InternalKeyword():
-                visibility = "internal"
-            elif ctx.modifierList().PublicKeyword():
-                visibility = "public"
-            else:
-                visibility = "default"
+            visibility = self._visibility(ctxModifierList, _CONSTRUCTOR_VISIBILITIES)
             isConstructor = True
         elif func_desc_child == "fallback":
-            parameters = [self.visit(x) for x in ctx.parameterList().parameter()]
+            parameters = list(map(self.visitParameter, ctx.parameterList().parameter()))
             returnParameters = (
                 self.visitReturnParameters(ctxReturnParameters)
                 if ctxReturnParameters
@@ -335,32 +398,25 @@ class SGPVisitor(SolidityVisitor):
             visibility = "external"
             isReceiveEther = True
         elif func_desc_child == "function":
-            identifier = ctx.functionDescriptor().identifier()
+            identifier = ctxFunctionDescriptor.identifier()
             name = self._to_text(identifier) if identifier is not None else ""
-            parameters = [self.visit(x) for x in ctx.parameterList().parameter()]
+            parameters = list(map(self.visitParameter, ctx.parameterList().parameter()))
             returnParameters = (
                 self.visitReturnParameters(ctxReturnParameters)
                 if ctxReturnParameters
                 else None
             )
             # parse function visibility
-            if ctx.modifierList().ExternalKeyword():
-                visibility = "external"
-            elif ctx.modifierList().InternalKeyword():
-                visibility = "internal"
-            elif ctx.modifierList().PublicKeyword():
-                visibility = "public"
-            elif ctx.modifierList().PrivateKeyword():
-                visibility = "private"
+            visibility = self._visibility(ctxModifierList, _FUNCTION_VISIBILITIES)
             isConstructor = name == self._current_contract
             isFallback = name == ""
 
         # check if function is virtual
-        if ctx.modifierList().VirtualKeyword():
+        if ctxModifierList.VirtualKeyword():
             isVirtual = True
 
         override = None
-        overrideSpecifier = ctx.modifierList().overrideSpecifier()
+        overrideSpecifier = ctxModifierList.overrideSpecifier()
         if overrideSpecifier:
             override = [
                 self.visitUserDefinedTypeName(x)
@@ -387,7 +443,7 @@ class SGPVisitor(SolidityVisitor):
     def visitEnumDefinition(self, ctx: SP.EnumDefinitionContext) -> EnumDefinition:
         node = EnumDefinition(
             name=self._to_text(ctx.identifier()),
-            members=[self.visitEnumValue(x) for x in ctx.enumValue()],
+            members=list(map(self.visitEnumValue, ctx.enumValue())),
         )
 
         return self._add_meta(node, ctx)
@@ -399,20 +455,24 @@ class SGPVisitor(SolidityVisitor):
     def visitElementaryTypeName(
         self, ctx: SP.ElementaryTypeNameContext
     ) -> ElementaryTypeName:
-        node = ElementaryTypeName(name=self._to_text(ctx), state_mutability=None)
+        node = ElementaryTypeName(
+            name=sys.intern(self._to_text(ctx)), state_mutability=None
+        )
 
         return self._add_meta(node, ctx)
 
     def visitIdentifier(self, ctx: SP.IdentifierContext) -> Identifier:
-        node = Identifier(name=self._to_text(ctx))
+        # Names repeat throughout a source, so all their nodes share one string
+        node = Identifier(name=sys.intern(self._to_text(ctx)))
         return self._add_meta(node, ctx)
 
     def visitTypeName(
         self, ctx: SP.TypeNameContext
     ) -> Union[ArrayTypeName, ElementaryTypeName, UserDefinedTypeName]:
-        if ctx.children and len(ctx.children) > 2:
+        children = ctx.children
+        if children and len(children) > 2:
             length = None
-            if len(ctx.children) == 4:
+            if len(children) == 4:
                 expression = ctx.expression()
                 if expression is None:
                     raise Exception(
@@ -429,22 +489,25 @@ class SGPVisitor(SolidityVisitor):
 
             return self._add_meta(node, ctx)
 
-        if ctx.children and len(ctx.children) == 2:
+        if children and len(children) == 2:
             node = ElementaryTypeName(
-                name=self._to_text(ctx.getChild(0)),
-                state_mutability=self._to_text(ctx.getChild(1)),
+                name=self._to_text(children[0]),
+                state_mutability=self._to_text(children[1]),
             )
 
             return self._add_meta(node, ctx)
 
-        if ctx.elementaryTypeName() is not None:
-            return self.visitElementaryTypeName(ctx.elementaryTypeName())
-        if ctx.userDefinedTypeName() is not None:
-            return self.visitUserDefinedTypeName(ctx.userDefinedTypeName())
-        if ctx.mapping() is not None:
-            return self.visitMapping(ctx.mapping())
-        if ctx.functionTypeName() is not None:
-            return self.visitFunctionTypeName(ctx.functionTypeName())
+        # Otherwise the only child is the type itself
+        child = children[0] if children else None
+        childType = type(child)
+        if childType is _ElementaryTypeNameContext:
+            return self.visitElementaryTypeName(child)
+        if childType is _UserDefinedTypeNameContext:
+            return self.visitUserDefinedTypeName(child)
+        if childType is _MappingContext:
+            return self.visitMapping(child)
+        if childType is _FunctionTypeNameContext:
+            return self.visitFunctionTypeName(child)
 
         raise Exception("Assertion error: unhandled type name case")
 
@@ -521,7 +584,7 @@ class SGPVisitor(SolidityVisitor):
     ) -> InheritanceSpecifier:
         exprList = ctx.expressionList()
         args = (
-            [self.visitExpression(x) for x in exprList.expression()]
+            list(map(self.visitExpression, exprList.expression()))
             if exprList is not None
             else []
         )
@@ -539,7 +602,7 @@ class SGPVisitor(SolidityVisitor):
         exprList = ctx.expressionList()
 
         args = (
-            [self.visit(x) for x in exprList.expression()]
+            list(map(self.visitExpression, exprList.expression()))
             if exprList is not None
             else []
         )
@@ -590,8 +653,9 @@ class SGPVisitor(SolidityVisitor):
     def visitFunctionTypeParameter(
         self, ctx: SP.FunctionTypeParameterContext
     ) -> VariableDeclaration:
+        ctxStorageLocation = ctx.storageLocation()
         storageLocation = (
-            self._to_text(ctx.storageLocation()) if ctx.storageLocation() else None
+            self._to_text(ctxStorageLocation) if ctxStorageLocation else None
         )
 
         node = VariableDeclaration(
@@ -607,14 +671,13 @@ class SGPVisitor(SolidityVisitor):
         return self._add_meta(node, ctx)
 
     def visitThrowStatement(self, ctx: SP.ThrowStatementContext) -> ThrowStatement:
-        node = ThrowStatement(type="ThrowStatement")
+        node = ThrowStatement()
 
         return self._add_meta(node, ctx)
 
     def visitReturnStatement(self, ctx: SP.ReturnStatementContext) -> ReturnStatement:
-        expression = (
-            self.visitExpression(ctx.expression()) if ctx.expression() else None
-        )
+        ctxExpression = ctx.expression()
+        expression = self.visitExpression(ctxExpression) if ctxExpression else None
 
         node = ReturnStatement(expression=expression)
 
@@ -651,23 +714,15 @@ class SGPVisitor(SolidityVisitor):
         return self._add_meta(node, ctx)
 
     def visitFunctionCall(self, ctx: SP.FunctionCallContext) -> FunctionCall:
-        args = []
-        names = []
-        identifiers = []
+        args, names, identifiers = [], [], []
 
         ctxArgs = ctx.functionCallArguments()
         ctxArgsExpressionList = ctxArgs.expressionList()
         ctxArgsNameValueList = ctxArgs.nameValueList()
         if ctxArgsExpressionList:
-            args = [
-                self.visitExpression(exprCtx)
-                for exprCtx in ctxArgsExpressionList.expression()
-            ]
+            args = list(map(self.visitExpression, ctxArgsExpressionList.expression()))
         elif ctxArgsNameValueList:
-            for nameValue in ctxArgsNameValueList.nameValue():
-                args.append(self.visitExpression(nameValue.expression()))
-                names.append(self._to_text(nameValue.identifier()))
-                identifiers.append(self.visitIdentifier(nameValue.identifier()))
+            args, names, identifiers = self._name_values(ctxArgsNameValueList)
 
         node = FunctionCall(
             expression=self.visitExpression(ctx.expression()),
@@ -683,9 +738,7 @@ class SGPVisitor(SolidityVisitor):
     ) -> StructDefinition:
         node = StructDefinition(
             name=self._to_text(ctx.identifier()),
-            members=[
-                self.visitVariableDeclaration(x) for x in ctx.variableDeclaration()
-            ],
+            members=list(map(self.visitVariableDeclaration, ctx.variableDeclaration())),
         )
 
         return self._add_meta(node, ctx)
@@ -709,11 +762,12 @@ class SGPVisitor(SolidityVisitor):
         return self._add_meta(node, ctx)
 
     def visitIfStatement(self, ctx: SP.IfStatementContext) -> IfStatement:
-        trueBody = self.visitStatement(ctx.statement(0))
+        statements = ctx.statement()
+        trueBody = self.visitStatement(statements[0])
 
         falseBody = None
-        if len(ctx.statement()) > 1:
-            falseBody = self.visitStatement(ctx.statement(1))
+        if len(statements) > 1:
+            falseBody = self.visitStatement(statements[1])
 
         node = IfStatement(
             condition=self.visitExpression(ctx.expression()),
@@ -729,7 +783,7 @@ class SGPVisitor(SolidityVisitor):
         if ctxReturnParameters is not None:
             returnParameters = self.visitReturnParameters(ctxReturnParameters)
 
-        catchClauses = [self.visitCatchClause(exprCtx) for exprCtx in ctx.catchClause()]
+        catchClauses = list(map(self.visitCatchClause, ctx.catchClause()))
 
         node = TryStatement(
             expression=self.visitExpression(ctx.expression()),
@@ -788,10 +842,12 @@ class SGPVisitor(SolidityVisitor):
     def visitMappingKey(
         self, ctx: SP.MappingKeyContext
     ) -> Union[ElementaryTypeName, UserDefinedTypeName]:
-        if ctx.elementaryTypeName():
-            return self.visitElementaryTypeName(ctx.elementaryTypeName())
-        elif ctx.userDefinedTypeName():
-            return self.visitUserDefinedTypeName(ctx.userDefinedTypeName())
+        ctxElementaryTypeName = ctx.elementaryTypeName()
+        if ctxElementaryTypeName:
+            return self.visitElementaryTypeName(ctxElementaryTypeName)
+        ctxUserDefinedTypeName = ctx.userDefinedTypeName()
+        if ctxUserDefinedTypeName:
+            return self.visitUserDefinedTypeName(ctxUserDefinedTypeName)
         else:
             raise Exception(
                 "Expected MappingKey to have either elementaryTypeName or userDefinedTypeName"
@@ -822,10 +878,11 @@ class SGPVisitor(SolidityVisitor):
         self, ctx: SP.ModifierDefinitionContext
     ) -> ModifierDefinition:
         parameters = None
-        if ctx.parameterList():
-            parameters = self.visitParameterList(ctx.parameterList())
+        ctxParameterList = ctx.parameterList()
+        if ctxParameterList:
+            parameters = self.visitParameterList(ctxParameterList)
 
-        isVirtual = len(ctx.VirtualKeyword()) > 0
+        isVirtual = bool(ctx.VirtualKeyword())
 
         override = None
         overrideSpecifier = ctx.overrideSpecifier()
@@ -859,105 +916,94 @@ class SGPVisitor(SolidityVisitor):
 
     def visitExpression(self, ctx: SP.ExpressionContext) -> Expression:
         op = None
+        children = ctx.children
+        childCount = len(children)
 
-        if len(ctx.children) == 1:
-            # primary expression
-            primaryExpressionCtx = ctx.getTypedRuleContext(
-                SP.PrimaryExpressionContext, 0
-            )
-            if primaryExpressionCtx is None:
+        if childCount == 1:
+            # primary expression, the only child
+            primaryExpressionCtx = children[0]
+            if type(primaryExpressionCtx) is not _PrimaryExpressionContext:
                 raise Exception(
                     "Assertion error: primary expression should exist when children length is 1"
                 )
             return self.visitPrimaryExpression(primaryExpressionCtx)
-        elif len(ctx.children) == 2:
-            op = self._to_text(ctx.getChild(0))
+        elif childCount == 2:
+            op = _terminal_text(children[0])
 
             # new expression
             if op == "new":
-                node = NewExpression(type_name=self.visitTypeName(ctx.typeName()))
+                node = NewExpression(type_name=self.visitTypeName(children[1]))
                 return self._add_meta(node, ctx)
 
             # prefix operators
             if op in UNARY_OP_VALUES:
                 node = UnaryOperation(
                     operator=op,
-                    sub_expression=self.visitExpression(
-                        ctx.getTypedRuleContext(SP.ExpressionContext, 0)
-                    ),
+                    sub_expression=self.visitExpression(children[1]),
                     is_prefix=True,
                 )
                 return self._add_meta(node, ctx)
 
-            op = self._to_text(ctx.getChild(1))
+            op = _terminal_text(children[1])
 
             # postfix operators
             if op in ["++", "--"]:
                 node = UnaryOperation(
                     operator=op,
-                    sub_expression=self.visitExpression(
-                        ctx.getTypedRuleContext(SP.ExpressionContext, 0)
-                    ),
+                    sub_expression=self.visitExpression(children[0]),
                     is_prefix=False,
                 )
                 return self._add_meta(node, ctx)
-        elif len(ctx.children) == 3:
+        elif childCount == 3:
             # treat parenthesis as no-op
             if (
-                self._to_text(ctx.getChild(0)) == "("
-                and self._to_text(ctx.getChild(2)) == ")"
+                _terminal_text(children[0]) == "("
+                and _terminal_text(children[2]) == ")"
             ):
                 node = TupleExpression(
-                    components=[
-                        self.visitExpression(
-                            ctx.getTypedRuleContext(SP.ExpressionContext, 0)
-                        )
-                    ],
+                    components=[self.visitExpression(children[1])],
                     isArray=False,
                 )
                 return self._add_meta(node, ctx)
 
-            op = self._to_text(ctx.getChild(1))
+            op = _terminal_text(children[1])
 
             # member access
             if op == ".":
                 node = MemberAccess(
-                    expression=self.visitExpression(ctx.expression(0)),
-                    member_name=self._to_text(ctx.identifier()),
+                    expression=self.visitExpression(children[0]),
+                    member_name=self._to_text(children[2]),
                 )
                 return self._add_meta(node, ctx)
 
             if op in BINARY_OP_VALUES:
                 node = BinaryOperation(
                     operator=op,
-                    left=self.visitExpression(ctx.expression(0)),
-                    right=self.visitExpression(ctx.expression(1)),
+                    left=self.visitExpression(children[0]),
+                    right=self.visitExpression(children[2]),
                 )
                 return self._add_meta(node, ctx)
-        elif len(ctx.children) == 4:
+        elif childCount == 4:
+            # Every form here is `expression <open> ... <close>`
+            bracket = _terminal_text(children[1])
+            closing = _terminal_text(children[3])
+
             # function call
-            if (
-                self._to_text(ctx.getChild(1)) == "("
-                and self._to_text(ctx.getChild(3)) == ")"
-            ):
-                args = []
-                names = []
-                identifiers = []
-
-                ctxArgs = ctx.functionCallArguments()
-                if ctxArgs.expressionList():
-                    args = [
-                        self.visitExpression(exprCtx)
-                        for exprCtx in ctxArgs.expressionList().expression()
-                    ]
-                elif ctxArgs.nameValueList():
-                    for nameValue in ctxArgs.nameValueList().nameValue():
-                        args.append(self.visitExpression(nameValue.expression()))
-                        names.append(self._to_text(nameValue.identifier()))
-                        identifiers.append(self.visitIdentifier(nameValue.identifier()))
+            if bracket == "(" and closing == ")":
+                args, names, identifiers = [], [], []
+
+                ctxArgs = children[2]
+                ctxArgsExpressionList = ctxArgs.expressionList()
+                ctxArgsNameValueList = ctxArgs.nameValueList()
+                if ctxArgsExpressionList:
+                    args = list(
+                        map(self.visitExpression, ctxArgsExpressionList.expression())
+                    )
+                elif ctxArgsNameValueList:
+                    args, names, identifiers = self._name_values(ctxArgsNameValueList)
 
                 node = FunctionCall(
-                    expression=self.visitExpression(ctx.expression(0)),
+                    expression=self.visitExpression(children[0]),
                     arguments=args,
                     names=names,
                     identifiers=identifiers,
@@ -966,97 +1012,98 @@ class SGPVisitor(SolidityVisitor):
                 return self._add_meta(node, ctx)
 
             # index access
-            if (
-                self._to_text(ctx.getChild(1)) == "["
-                and self._to_text(ctx.getChild(3)) == "]"
-            ):
-                if ctx.getChild(2).getText() == ":":
+            if bracket == "[" and closing == "]":
+                if _terminal_text(children[2]) == ":":
                     node = IndexRangeAccess(
-                        base=self.visitExpression(ctx.expression(0)),
+                        base=self.visitExpression(children[0]),
                     )
                     return self._add_meta(node, ctx)
 
                 node = IndexAccess(
-                    base=self.visitExpression(ctx.expression(0)),
-                    index=self.visitExpression(ctx.expression(1)),
+                    base=self.visitExpression(children[0]),
+                    index=self.visitExpression(children[2]),
                 )
 
                 return self._add_meta(node, ctx)
 
             # expression with nameValueList
-            if (
-                self._to_text(ctx.getChild(1)) == "{"
-                and self._to_text(ctx.getChild(3)) == "}"
-            ):
+            if bracket == "{" and closing == "}":
                 node = NameValueExpression(
-                    expression=self.visitExpression(ctx.expression(0)),
-                    arguments=self.visitNameValueList(ctx.nameValueList()),
+                    expression=self.visitExpression(children[0]),
+                    arguments=self.visitNameValueList(children[2]),
                 )
 
                 return self._add_meta(node, ctx)
-        elif len(ctx.children) == 5:
+        elif childCount == 5:
+            op = _terminal_text(children[1])
+
             # ternary operator
-            if (
-                self._to_text(ctx.getChild(1)) == "?"
-                and self._to_text(ctx.getChild(3)) == ":"
-            ):
+            if op == "?" and _terminal_text(children[3]) == ":":
                 node = Conditional(
-                    condition=self.visitExpression(ctx.expression(0)),
-                    true_expression=self.visitExpression(ctx.expression(1)),
-                    false_expression=self.visitExpression(ctx.expression(2)),
+                    condition=self.visitExpression(children[0]),
+                    true_expression=self.visitExpression(children[2]),
+                    false_expression=self.visitExpression(children[4]),
                 )
 
                 return self._add_meta(node, ctx)
 
             # index range access
             if (
-                self._to_text(ctx.getChild(1)) == "["
-                and self._to_text(ctx.getChild(2)) == ":"
-                and self._to_text(ctx.getChild(4)) == "]"
+                op == "["
+                and _terminal_text(children[2]) == ":"
+                and _terminal_text(children[4]) == "]"
             ):
                 node = IndexRangeAccess(
-                    base=self.visitExpression(ctx.expression(0)),
-                    index_end=self.visitExpression(ctx.expression(1)),
+                    base=self.visitExpression(children[0]),
+                    index_end=self.visitExpression(children[3]),
                 )
 
                 return self._add_meta(node, ctx)
             elif (
-                self._to_text(ctx.getChild(1)) == "["
-                and self._to_text(ctx.getChild(3)) == ":"
-                and self._to_text(ctx.getChild(4)) == "]"
+                op == "["
+                and _terminal_text(children[3]) == ":"
+                and _terminal_text(children[4]) == "]"
             ):
                 node = IndexRangeAccess(
-                    base=self.visitExpression(ctx.expression(0)),
-                    index_start=self.visitExpression(ctx.expression(1)),
+                    base=self.visitExpression(children[0]),
+                    index_start=self.visitExpression(children[2]),
                 )
 
                 return self._add_meta(node, ctx)
-        elif len(ctx.children) == 6:
+        elif childCount == 6:
             # index range access
             if (
-                self._to_text(ctx.getChild(1)) == "["
-                and self._to_text(ctx.getChild(3)) == ":"
-                and self._to_text(ctx.getChild(5)) == "]"
+                _terminal_text(children[1]) == "["
+                and _terminal_text(children[3]) == ":"
+                and _terminal_text(children[5]) == "]"
             ):
                 node = IndexRangeAccess(
-                    base=self.visitExpression(ctx.expression(0)),
-                    index_start=self.visitExpression(ctx.expression(1)),
-                    index_end=self.visitExpression(ctx.expression(2)),
+                    base=self.visitExpression(children[0]),
+                    index_start=self.visitExpression(children[2]),
+                    index_end=self.visitExpression(children[4]),
                 )
 
                 return self._add_meta(node, ctx)
 
-        raise Exception("Unrecognized expression")
+        raise UnrecognizedExpressionError(ctx)
 
-    def visitNameValueList(self, ctx: SP.NameValueListContext) -> NameValueList:
+    def _name_values(
+        self, ctx: SP.NameValueListContext
+    ) -> Tuple[List[Expression], List[str], List[Identifier]]:
+        args = []
         names = []
         identifiers = []
-        args = []
 
         for nameValue in ctx.nameValue():
-            names.append(self._to_text(nameValue.identifier()))
-            identifiers.append(self.visitIdentifier(nameValue.identifier()))
+            identifierCtx = nameValue.identifier()
             args.append(self.visitExpression(nameValue.expression()))
+            names.append(self._to_text(identifierCtx))
+            identifiers.append(self.visitIdentifier(identifierCtx))
+
+        return args, names, identifiers
+
+    def visitNameValueList(self, ctx: SP.NameValueListContext) -> NameValueList:
+        args, names, identifiers = self._name_values(ctx)
 
         node = NameValueList(names=names, identifiers=identifiers, arguments=args)
 
@@ -1082,19 +1129,26 @@ class SGPVisitor(SolidityVisitor):
         return self._add_meta(node, ctx)
 
     def visitForStatement(self, ctx: SP.ForStatementContext) -> ForStatement:
-        conditionExpression = self.visitExpressionStatement(ctx.expressionStatement())
-        if conditionExpression:
-            conditionExpression = conditionExpression.expression
+        # Only the expression of the condition statement is kept, so visit it
+        # directly rather than building the statement node around it
+        conditionExpression = None
+        ctxExpressionStatement = ctx.expressionStatement()
+        if ctxExpressionStatement:
+            conditionExpression = self.visitExpression(
+                ctxExpressionStatement.expression()
+            )
+        ctxSimpleStatement = ctx.simpleStatement()
+        ctxExpression = ctx.expression()
         node = ForStatement(
             init_expression=(
-                self.visitSimpleStatement(ctx.simpleStatement())
-                if ctx.simpleStatement()
+                self.visitSimpleStatement(ctxSimpleStatement)
+                if ctxSimpleStatement
                 else None
             ),
             condition_expression=conditionExpression,
             loop_expression=ExpressionStatement(
                 expression=(
-                    self.visitExpression(ctx.expression()) if ctx.expression() else None
+                    self.visitExpression(ctxExpression) if ctxExpression else None
                 ),
             ),
             body=self.visitStatement(ctx.statement()),
@@ -1111,55 +1165,57 @@ class SGPVisitor(SolidityVisitor):
     def visitPrimaryExpression(
         self, ctx: SP.PrimaryExpressionContext
     ) -> Union[PrimaryExpression, Any]:
-        if ctx.BooleanLiteral():
-            node = BooleanLiteral(value=self._to_text(ctx.BooleanLiteral()) == "true")
-            return self._add_meta(node, ctx)
-
-        if ctx.hexLiteral():
-            return self.visitHexLiteral(ctx.hexLiteral())
+        if ctx.children == None:
+            return self.visitErrorNode(ctx.start)
 
-        if ctx.stringLiteral():
-            fragments = ctx.stringLiteral().StringLiteralFragment()
-            fragments_info = []
+        # Every alternative is a single child, so dispatch on its class (or its
+        # token type) instead of asking the context for each alternative in turn.
+        # Identifiers come first as most primary expressions are one.
+        child = ctx.children[0]
+        childType = type(child)
+        if childType is _IdentifierContext:
+            return self.visitIdentifier(child)
+        if childType is _NumberLiteralContext:
+            return self.visitNumberLiteral(child)
+        if childType is _TypeNameContext:
+            return self.visitTypeName(child)
+        if childType is _HexLiteralContext:
+            return self.visitHexLiteral(child)
+
+        if childType is _StringLiteralContext:
+            fragments = child.StringLiteralFragment()
+            parts = []
+            is_unicode_parts = []
 
             for string_literal_fragment_ctx in fragments:
                 text = self._to_text(string_literal_fragment_ctx)
 
-                is_unicode = text[:7] == "unicode"
-                if is_unicode:
-                    text = text[7:]
-
-                single_quotes = text[0] == """"""
-                text_without_quotes = text[1:-1]
-                if single_quotes:
-                    value = text_without_quotes.replace(r"'", "")
-                else:
-                    value = text_without_quotes.replace(r'"', "")
+                # One slice drops the optional `unicode` prefix and the quotes.
+                # Only double quotes are stripped from the value, whichever
+                # quotes the fragment uses.
+                is_unicode = text.startswith("unicode")
+                value = (text[8:-1] if is_unicode else text[1:-1]).replace('"', "")
 
-                fragments_info.append({"value": value, "is_unicode": is_unicode})
+                parts.append(value)
+                is_unicode_parts.append(is_unicode)
 
-            parts = [x["value"] for x in fragments_info]
             node = StringLiteral(
                 value="".join(parts),
                 parts=parts,
-                is_unicode=[x["is_unicode"] for x in fragments_info],
+                is_unicode=is_unicode_parts,
             )
             return self._add_meta(node, ctx)
 
-        if ctx.numberLiteral():
-            return self.visitNumberLiteral(ctx.numberLiteral())
-
-        if ctx.TypeKeyword():
-            node = Identifier(name="type")
-            return self._add_meta(node, ctx)
-
-        if ctx.typeName():
-            return self.visitTypeName(ctx.typeName())
-
-        if ctx.children == None:
-            return self.visitErrorNode(ctx.start)
+        if isinstance(child, TerminalNode):
+            tokenType = child.symbol.type
+            if tokenType == SP.BooleanLiteral:
+                node = BooleanLiteral(value=self._to_text(child) == "true")
+                return self._add_meta(node, ctx)
+            if tokenType == SP.TypeKeyword:
+                node = Identifier(name="type")
+                return self._add_meta(node, ctx)
 
-        return self.visit(ctx.getChild(0))
+        return self.visit(child)
 
     def visitTupleExpression(self, ctx: SP.TupleExpressionContext) -> TupleExpression:
         children = ctx.children[1:-1]  # remove parentheses
@@ -1179,8 +1235,6 @@ class SGPVisitor(SolidityVisitor):
         self, ctx: SP.IdentifierListContext
     ) -> List[Optional[VariableDeclaration]]:
         children = ctx.children[1:-1]  # remove parentheses
-        identifiers = ctx.identifier()
-        i = 0
         return [
             self.visitIdentifier(iden) if iden is not None else None
             for iden in self._map_commas_to_nulls(children)
@@ -1189,8 +1243,6 @@ class SGPVisitor(SolidityVisitor):
     def buildVariableDeclarationList(
         self, ctx: SP.VariableDeclarationListContext
     ) -> List[Optional[VariableDeclaration]]:
-        variableDeclarations = ctx.variableDeclaration()
-        i = 0
         return [
             self.buildVariableDeclaration(decl) if decl is not None else None
             for decl in self._map_commas_to_nulls(ctx.children or [])
@@ -1222,39 +1274,38 @@ class SGPVisitor(SolidityVisitor):
         symbolAliases = None
         symbolAliasesIdentifiers = None
 
-        if len(ctx.importDeclaration()) > 0:
-            symbolAliases = [
-                (
+        importDeclarations = ctx.importDeclaration()
+        if len(importDeclarations) > 0:
+            # Both lists are filled in one pass, fetching each declaration's
+            # identifiers once
+            symbolAliases = []
+            symbolAliasesIdentifiers = []
+            for decl in importDeclarations:
+                identifiers = decl.identifier()
+                symbolCtx = identifiers[0]
+                aliasCtx = identifiers[1] if len(identifiers) > 1 else None
+                symbolAliases.append(
                     [
-                        self._to_text(decl.identifier(0)),
-                        self._to_text(decl.identifier(1)),
+                        self._to_text(symbolCtx),
+                        self._to_text(aliasCtx) if aliasCtx else None,
                     ]
-                    if len(decl.identifier()) > 1
-                    else [self._to_text(decl.identifier(0)), None]
                 )
-                for decl in ctx.importDeclaration()
-            ]
-            symbolAliasesIdentifiers = [
-                (
+                symbolAliasesIdentifiers.append(
                     [
-                        self.visitIdentifier(decl.identifier(0)),
-                        self.visitIdentifier(decl.identifier(1)),
+                        self.visitIdentifier(symbolCtx),
+                        self.visitIdentifier(aliasCtx) if aliasCtx else None,
                     ]
-                    if len(decl.identifier()) > 1
-                    else [self.visitIdentifier(decl.identifier(0)), None]
                 )
-                for decl in ctx.importDeclaration()
-            ]
         else:
             identifierCtxList = ctx.identifier()
             if len(identifierCtxList) == 0:
                 pass
             elif len(identifierCtxList) == 1:
-                aliasIdentifierCtx = ctx.identifier(0)
+                aliasIdentifierCtx = identifierCtxList[0]
                 unitAlias = self._to_text(aliasIdentifierCtx)
                 unitAliasIdentifier = self.visitIdentifier(aliasIdentifierCtx)
             elif len(identifierCtxList) == 2:
-                aliasIdentifierCtx = ctx.identifier(1)
+                aliasIdentifierCtx = identifierCtxList[1]
                 unitAlias = self._to_text(aliasIdentifierCtx)
                 unitAliasIdentifier = self.visitIdentifier(aliasIdentifierCtx)
             else:
@@ -1284,20 +1335,19 @@ class SGPVisitor(SolidityVisitor):
     def buildEventParameterList(
         self, ctx: SP.EventParameterListContext
     ) -> List[VariableDeclaration]:
-        return [
-            VariableDeclaration(
-                type="VariableDeclaration",
-                type_name=self.visit(paramCtx.typeName()),
-                name=(
-                    self._to_text(paramCtx.identifier())
-                    if paramCtx.identifier()
-                    else None
-                ),
-                is_state_var=False,
-                is_indexed=bool(paramCtx.IndexedKeyword()),
+        parameters = []
+        for paramCtx in ctx.eventParameter():
+            identifierCtx = paramCtx.identifier()
+            parameters.append(
+                VariableDeclaration(
+                    type_name=self.visitTypeName(paramCtx.typeName()),
+                    name=self._to_text(identifierCtx) if identifierCtx else None,
+                    is_state_var=False,
+                    is_indexed=bool(paramCtx.IndexedKeyword()),
+                )
             )
-            for paramCtx in ctx.eventParameter()
-        ]
+
+        return parameters
 
     def visitReturnParameters(
         self, ctx: SP.ReturnParametersContext
@@ -1307,7 +1357,7 @@ class SGPVisitor(SolidityVisitor):
     def visitParameterList(
         self, ctx: SP.ParameterListContext
     ) -> List[VariableDeclaration]:
-        return [self.visitParameter(paramCtx) for paramCtx in ctx.parameter()]
+        return list(map(self.visitParameter, ctx.parameter()))
 
     def visitInlineAssemblyStatement(
         self, ctx: SP.InlineAssemblyStatementContext
@@ -1345,11 +1395,14 @@ class SGPVisitor(SolidityVisitor):
     ) -> Union[HexLiteral, StringLiteral, Break, Continue, AssemblyItem]:
         text = None
 
-        if ctx.hexLiteral():
-            return self.visitHexLiteral(ctx.hexLiteral())
+        # Dispatch on the only child, as in `visitPrimaryExpression`
+        child = ctx.getChild(0)
+        childType = type(child)
+        if childType is _HexLiteralContext:
+            return self.visitHexLiteral(child)
 
-        if ctx.stringLiteral():
-            text = self._to_text(ctx.stringLiteral())
+        if childType is _StringLiteralContext:
+            text = self._to_text(child)
             value = text[1:-1]
             node = StringLiteral(
                 value=value,
@@ -1361,17 +1414,19 @@ class SGPVisitor(SolidityVisitor):
 
             return self._add_meta(node, ctx)
 
-        if ctx.BreakKeyword():
-            node = Break()
+        if isinstance(child, TerminalNode):
+            tokenType = child.symbol.type
+            if tokenType == SP.BreakKeyword:
+                node = Break()
 
-            return self._add_meta(node, ctx)
+                return self._add_meta(node, ctx)
 
-        if ctx.ContinueKeyword():
-            node = Continue()
+            if tokenType == SP.ContinueKeyword:
+                node = Continue()
 
-            return self._add_meta(node, ctx)
+                return self._add_meta(node, ctx)
 
-        return self.visit(ctx.getChild(0))
+        return self.visit(child)
 
     def visitAssemblyExpression(
         self, ctx: SP.AssemblyExpressionContext
@@ -1380,10 +1435,7 @@ class SGPVisitor(SolidityVisitor):
 
     def visitAssemblyCall(self, ctx: SP.AssemblyCallContext) -> AssemblyCall:
         functionName = self._to_text(ctx.getChild(0))
-        args = [
-            self.visitAssemblyExpression(assemblyExpr)
-            for assemblyExpr in ctx.assemblyExpression()
-        ]
+        args = list(map(self.visitAssemblyExpression, ctx.assemblyExpression()))
 
         node = AssemblyCall(
             function_name=functionName,
@@ -1403,7 +1455,11 @@ class SGPVisitor(SolidityVisitor):
     ]:
         text = None
 
-        if ctx.stringLiteral():
+        # Dispatch on the only child, as in `visitPrimaryExpression`
+        child = ctx.getChild(0)
+        tokenType = child.symbol.type if isinstance(child, TerminalNode) else None
+
+        if type(child) is _StringLiteralContext:
             text = self._to_text(ctx)
             value = text[1:-1]
             node = StringLiteral(
@@ -1416,29 +1472,29 @@ class SGPVisitor(SolidityVisitor):
 
             return self._add_meta(node, ctx)
 
-        if ctx.BooleanLiteral():
+        if tokenType == SP.BooleanLiteral:
             node = BooleanLiteral(
-                value=self._to_text(ctx.BooleanLiteral()) == "true",
+                value=self._to_text(child) == "true",
             )
 
             return self._add_meta(node, ctx)
 
-        if ctx.DecimalNumber():
+        if tokenType == SP.DecimalNumber:
             node = DecimalNumber(
                 value=self._to_text(ctx),
             )
 
             return self._add_meta(node, ctx)
 
-        if ctx.HexNumber():
+        if tokenType == SP.HexNumber:
             node = HexNumber(
                 value=self._to_text(ctx),
             )
 
             return self._add_meta(node, ctx)
 
-        if ctx.hexLiteral():
-            return self.visitHexLiteral(ctx.hexLiteral())
+        if type(child) is _HexLiteralContext:
+            return self.visitHexLiteral(child)
 
         raise ValueError("Should never reach here")
 
@@ -1466,22 +1522,12 @@ class SGPVisitor(SolidityVisitor):
     def visitAssemblyLocalDefinition(
         self, ctx: SP.AssemblyLocalDefinitionContext
     ) -> AssemblyLocalDefinition:
-        ctxAssemblyIdentifierOrList = ctx.assemblyIdentifierOrList()
-        if ctxAssemblyIdentifierOrList.identifier():
-            names = [self.visitIdentifier(ctxAssemblyIdentifierOrList.identifier())]
-        elif ctxAssemblyIdentifierOrList.assemblyMember():
-            names = [
-                self.visitAssemblyMember(ctxAssemblyIdentifierOrList.assemblyMember())
-            ]
-        else:
-            names = [
-                self.visitIdentifier(x)
-                for x in ctxAssemblyIdentifierOrList.assemblyIdentifierList().identifier()
-            ]
+        names = self._assembly_names(ctx.assemblyIdentifierOrList())
 
         expression = None
-        if ctx.assemblyExpression() is not None:
-            expression = self.visitAssemblyExpression(ctx.assemblyExpression())
+        ctxAssemblyExpression = ctx.assemblyExpression()
+        if ctxAssemblyExpression is not None:
+            expression = self.visitAssemblyExpression(ctxAssemblyExpression)
 
         node = AssemblyLocalDefinition(
             names=names,
@@ -1495,17 +1541,19 @@ class SGPVisitor(SolidityVisitor):
     ):
         ctxAssemblyIdentifierList = ctx.assemblyIdentifierList()
         args = (
-            [self.visitIdentifier(x) for x in ctxAssemblyIdentifierList.identifier()]
+            list(map(self.visitIdentifier, ctxAssemblyIdentifierList.identifier()))
             if ctxAssemblyIdentifierList
             else []
         )
 
         ctxAssemblyFunctionReturns = ctx.assemblyFunctionReturns()
         returnArgs = (
-            [
-                self.visitIdentifier(x)
-                for x in ctxAssemblyFunctionReturns.assemblyIdentifierList().identifier()
-            ]
+            list(
+                map(
+                    self.visitIdentifier,
+                    ctxAssemblyFunctionReturns.assemblyIdentifierList().identifier(),
+                )
+            )
             if ctxAssemblyFunctionReturns
             else []
         )
@@ -1519,19 +1567,25 @@ class SGPVisitor(SolidityVisitor):
 
         return self._add_meta(node, ctx)
 
+    def _assembly_names(
+        self, ctx: SP.AssemblyIdentifierOrListContext
+    ) -> Union[List[Identifier], List[AssemblyMemberAccess]]:
+        # Shared by local definitions and assignments; fetches each alternative
+        # of the rule once
+        identifierCtx = ctx.identifier()
+        if identifierCtx:
+            return [self.visitIdentifier(identifierCtx)]
+
+        assemblyMemberCtx = ctx.assemblyMember()
+        if assemblyMemberCtx:
+            return [self.visitAssemblyMember(assemblyMemberCtx)]
+
+        return list(
+            map(self.visitIdentifier, ctx.assemblyIdentifierList().identifier())
+        )
+
     def visitAssemblyAssignment(self, ctx: SP.AssemblyAssignmentContext):
-        ctxAssemblyIdentifierOrList = ctx.assemblyIdentifierOrList()
-        if ctxAssemblyIdentifierOrList.identifier():
-            names = [self.visitIdentifier(ctxAssemblyIdentifierOrList.identifier())]
-        elif ctxAssemblyIdentifierOrList.assemblyMember():
-            names = [
-                self.visitAssemblyMember(ctxAssemblyIdentifierOrList.assemblyMember())
-            ]
-        else:
-            names = [
-                self.visitIdentifier(x)
-                for x in ctxAssemblyIdentifierOrList.assemblyIdentifierList().identifier()
-            ]
+        names = self._assembly_names(ctx.assemblyIdentifierOrList())
 
         node = AssemblyAssignment(
             names=names,
@@ -1597,76 +1651,75 @@ class SGPVisitor(SolidityVisitor):
         return self._add_meta(node, ctx)
 
     def _to_text(self, ctx: ParserRuleContext or ParseTree) -> str:
-        text = ctx.getText()
+        text = _tree_text(ctx)
         if text is None:
             raise ValueError("Assertion error: text should never be undefined")
 
         return text
 
-    def _stateMutabilityToText(
-        self, ctx: SP.StateMutabilityContext
-    ) -> FunctionDefinition:
-        if ctx.PureKeyword() is not None:
-            return "pure"
-        if ctx.ConstantKeyword() is not None:
-            return "constant"
-        if ctx.PayableKeyword() is not None:
-            return "payable"
-        if ctx.ViewKeyword() is not None:
-            return "view"
-
-        raise ValueError("Assertion error: non-exhaustive stateMutability check")
-
-    def _loc(self, ctx) -> Location:
-        start_line = ctx.start.line
-        start_column = ctx.start.column
-        end_line = ctx.stop.line if ctx.stop else start_line
-        end_column = ctx.stop.column if ctx.stop else start_column
-
-        source_location = Location(
-            start=(start_line, start_column), end=(end_line, end_column)
-        )
-
-        return source_location
-
-    def _range(self, ctx) -> Tuple[int, int]:
-        return Range(ctx.start.start, ctx.stop.stop if ctx.stop else ctx.start.stop)
+    def _visibility(
+        self, ctx: ParserRuleContext, visibilities: Tuple[Tuple[int, str], ...]
+    ) -> str:
+        # One pass over the children instead of one token getter per keyword
+        token_types = {
+            child.symbol.type
+            for child in ctx.children or ()
+            if isinstance(child, TerminalNode)
+        }
+        for token_type, visibility in visibilities:
+            if token_type in token_types:
+                return visibility
+        return "default"
+
+    def _stateMutabilityToText(self, ctx: SP.StateMutabilityContext) -> str:
+        # Looked up by the type of the keyword token rather than by asking the
+        # context for each keyword in turn
+        stateMutability = _STATE_MUTABILITIES.get(ctx.start.type)
+        if stateMutability is None:
+            raise ValueError("Assertion error: non-exhaustive stateMutability check")
+
+        return stateMutability
 
     def _add_meta(
         self, node: Union[BaseASTNode, NameValueList], ctx
     ) -> Union[BaseASTNode, NameValueList]:
-        # node_with_meta = {"type": node.type}
-
-        if self._options.loc:
-            node.add_loc(self._loc(ctx))
-
-        if self._options.range:
-            node.add_range(self._range(ctx))
+        # Runs once per node, so the start and stop tokens are read once for both
+        # the location and the range
+        options = self._options
+        if options.loc or options.range:
+            start = ctx.start
+            stop = ctx.stop or start
+            if options.loc:
+                node.loc = Location(
+                    start=(start.line, start.column), end=(stop.line, stop.column)
+                )
+            if options.range:
+                node.range = Range(start.start, stop.stop)
 
         return node
 
     def _map_commas_to_nulls(
         self, children: List[Optional[ParseTree]]
-    ) -> List[Optional[ParseTree]]:
+    ) -> Iterator[Optional[ParseTree]]:
+        # Yields rather than building a list, as every caller maps the result
+        # straight into the list it returns
         if len(children) == 0:
-            return []
+            return
 
-        values = []
         comma = True
 
+        # Only terminals can be commas, so elements are never turned into text
         for el in children:
             if comma:
-                if self._to_text(el) == ",":
-                    values.append(None)
+                if _terminal_text(el) == ",":
+                    yield None
                 else:
-                    values.append(el)
+                    yield el
                     comma = False
             else:
-                if self._to_text(el) != ",":
+                if _terminal_text(el) != ",":
                     raise ValueError("expected comma")
                 comma = True
 
         if comma:
-            values.append(None)
-
-        return values
+            yield None
@@ -1,4 +1,11 @@
-from typing import List, Dict, Any
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List
+
+from antlr4.Token import Token
+
+from .ast_node_types import Location
+from .sgp_visitor import SGPVisitorOptions
 
 
 def rsplit(input_string: str, value: str) -> List[str]:
@@ -56,39 +63,89 @@ def get_token_type_map(tokens: str) -> Dict[int, str]:
     token_map = {}
 
     for line in lines:
+        if not line:
+            continue
         value, key = rsplit(line, "=")
         token_map[int(key)] = normalize_token_type(value)
 
     return token_map
 
 
-# TODO: sort it out
+@lru_cache(maxsize=None)
+def _solidity_token_type_map() -> Dict[int, str]:
+    with open(
+        os.path.join(os.path.dirname(__file__), "parser", "Solidity.tokens")
+    ) as f:
+        return get_token_type_map(f.read())
+
+
+@lru_cache(maxsize=None)
+def _solidity_token_kinds() -> Dict[int, str]:
+    # The kind of every token type, as returned by `get_token_type`
+    return {
+        token_type: get_token_type(name)
+        for token_type, name in _solidity_token_type_map().items()
+    }
+
+
+class SGPToken:
+    """
+    A token of the source code, as listed in `SourceUnit.tokens`.
+
+    Attributes:
+    ----------
+    type: str - The kind of the token (Keyword, Identifier, Punctuator, ...)
+    value: str - The text of the token
+    range: List[int] - The offset of the start of the token and the offset right after its end
+    loc: Location - The location of the token in the source code
+    """
+
+    __slots__ = ("type", "value", "range", "loc")
+    _fields = __slots__
+
+    def __init__(self, type: str, value: str) -> None:
+        self.type: str = type
+        self.value: str = value
+
+
 def build_token_list(
-    tokens_arg: List[Dict[str, Any]], options: Dict[str, Any]
-) -> List[Dict[str, Any]]:
-    token_types = get_token_type_map(tokens_arg)
-    result = []
-
-    for token in tokens_arg:
-        type_str = get_token_type(token_types[token["type"]])
-        node = {"type": type_str, "value": token["text"]}
-
-        if options.get("range", False):
-            node["range"] = [token["startIndex"], token["stopIndex"] + 1]
-
-        if options.get("loc", False):
-            node["loc"] = {
-                "start": {"line": token["line"], "column": token["charPositionInLine"]},
-                "end": {
-                    "line": token["line"],
-                    "column": (
-                        token["charPositionInLine"] + len(token["text"])
-                        if token["text"]
-                        else 0
-                    ),
-                },
-            }
-
-        result.append(node)
-
-    return result
+    tokens: Iterable[Token], options: SGPVisitorOptions
+) -> Iterator[SGPToken]:
+    """
+    Convert the ANTLR tokens of a parsed source into `SGPToken`s, lazily.
+
+    Parameters
+    ----------
+    tokens : Iterable[Token] - The tokens of the token stream, EOF included.
+    options : SGPVisitorOptions - Whether to add the range and location of the tokens.
+
+    Returns
+    -------
+    Iterator[SGPToken] - The tokens of the source, without the EOF token.
+    """
+
+    token_kinds = _solidity_token_kinds()
+    eof = Token.EOF
+    with_range = options.range
+    with_loc = options.loc
+
+    for token in tokens:
+        token_type = token.type
+        if token_type == eof:
+            continue
+
+        text = token.text
+        node = SGPToken(token_kinds[token_type], text)
+
+        if with_range:
+            node.range = [token.start, token.stop + 1]
+
+        if with_loc:
+            line = token.line
+            column = token.column
+            node.loc = Location(
+                start=(line, column),
+                end=(line, column + (len(text) if text else 0)),
+            )
+
+        yield node
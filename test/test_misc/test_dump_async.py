@@ -0,0 +1,31 @@
+import json
+import os
+import tempfile
+import unittest
+
+from sgp.sgp_parser import parse, wait_for_dumps
+
+
+class TestDumpAsync(unittest.TestCase):
+    def test_async_dump_matches_ast(self) -> None:
+        input = """contract X { function a() public pure {} }"""
+
+        with tempfile.TemporaryDirectory() as dump_path:
+            res = parse(input, dump_json=True, dump_path=dump_path, dump_async=True)
+            expected = res.to_json()
+            res.children[0].name = "Y"
+            wait_for_dumps()
+            with open(os.path.join(dump_path, "ast.json")) as f:
+                self.assertEqual(expected, json.load(f))
+
+    def test_failed_async_dump_is_raised_by_wait(self) -> None:
+        input = """contract X { function a() public pure {} }"""
+
+        with tempfile.TemporaryDirectory() as dump_path:
+            # A directory in place of the file makes the write fail
+            os.mkdir(os.path.join(dump_path, "ast.json"))
+            parse(input, dump_json=True, dump_path=dump_path, dump_async=True)
+            with self.assertRaises(OSError):
+                wait_for_dumps()
+            # The error is reported once
+            wait_for_dumps()
@@ -0,0 +1,33 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sgp import ast_node_types
+from sgp.ast_node_types import dumps
+from sgp.sgp_parser import parse
+
+
+class TestDumpJson(unittest.TestCase):
+    def _dump(self, input: str) -> bytes:
+        with tempfile.TemporaryDirectory() as dump_path:
+            parse(input, dump_json=True, dump_path=dump_path)
+            with open(os.path.join(dump_path, "ast.json"), "rb") as f:
+                return f.read()
+
+    def test_dump_does_not_depend_on_orjson(self) -> None:
+        input = """contract X { string s = unicode"é"; }"""
+
+        expected = dumps(parse(input)).encode()
+        self.assertEqual(expected, self._dump(input))
+        with mock.patch.object(ast_node_types, "orjson", None):
+            self.assertEqual(expected, self._dump(input))
+
+    def test_fast_dump_of_deep_tree(self) -> None:
+        input = "contract X { uint x = " + "+".join(["a"] * 300) + "; }"
+
+        with tempfile.TemporaryDirectory() as dump_path:
+            res = parse(input, dump_json=True, dump_path=dump_path, fast_json=True)
+            with open(os.path.join(dump_path, "ast.json"), "rb") as f:
+                self.assertEqual(res.to_json(), json.loads(f.read()))
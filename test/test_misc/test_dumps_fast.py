@@ -0,0 +1,22 @@
+import json
+import unittest
+
+from sgp.ast_node_types import dumps_fast
+from sgp.sgp_parser import parse
+
+
+class TestDumpsFast(unittest.TestCase):
+    def test_dumps_fast_matches_to_json(self) -> None:
+        input = """import {A as B} from "./x.sol";
+contract X { uint a = 1; function b() public { a += 2; } }"""
+
+        res = parse(input)
+        self.assertEqual(res.to_json(), json.loads(dumps_fast(res)))
+        self.assertEqual(res.to_json(False), json.loads(dumps_fast(res, False)))
+
+    def test_dumps_fast_handles_deep_trees(self) -> None:
+        # Deeper than orjson's nesting limit
+        input = "contract X { uint x = " + "+".join(["a"] * 300) + "; }"
+
+        res = parse(input)
+        self.assertEqual(res.to_json(), json.loads(dumps_fast(res)))
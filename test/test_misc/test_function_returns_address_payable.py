@@ -4,42 +4,54 @@ from sgp.sgp_parser import parse
 
 
 class TestFunctionReturnsAddressPayable(unittest.TestCase):
-    def test_function_returns_address_payable(self) -> None:
-        input = """function test() public returns(address payable) {}"""
+    def _return_parameter(self, input: str):
+        # Shared checks: a lone function with exactly one return parameter
         ast = parse(input)
         self.assertIsNotNone(ast)
         self.assertEqual(1, len(ast.children))
-        self.assertEqual("FunctionDefinition", ast.children[0].type)
-        self.assertEqual(1, len(ast.children[0].return_parameters))
-        self.assertEqual(
-            "VariableDeclaration", ast.children[0].return_parameters[0].type
-        )
-        self.assertIsNone(ast.children[0].return_parameters[0].name)
-        self.assertIsNotNone(ast.children[0].return_parameters[0].type_name)
-        self.assertEqual(
-            "ElementaryTypeName", ast.children[0].return_parameters[0].type_name.type
+        function = ast.children[0]
+        self.assertEqual("FunctionDefinition", function.type)
+        self.assertEqual(1, len(function.return_parameters))
+        return_parameter = function.return_parameters[0]
+        self.assertIsNotNone(return_parameter.type_name)
+        return return_parameter
+
+    def _snapshot(self, return_parameter):
+        type_name = return_parameter.type_name
+        return {
+            "type": return_parameter.type,
+            "name": return_parameter.name,
+            "type_name_type": type_name.type,
+            "type_name_name": type_name.name,
+            "state_mutability": type_name.state_mutability,
+        }
+
+    def test_function_returns_address_payable(self) -> None:
+        return_parameter = self._return_parameter(
+            """function test() public returns(address payable) {}"""
         )
-        self.assertEqual("address", ast.children[0].return_parameters[0].type_name.name)
         self.assertEqual(
-            "payable", ast.children[0].return_parameters[0].type_name.state_mutability
+            {
+                "type": "VariableDeclaration",
+                "name": None,
+                "type_name_type": "ElementaryTypeName",
+                "type_name_name": "address",
+                "state_mutability": "payable",
+            },
+            self._snapshot(return_parameter),
         )
 
     def test_function_returns_address(self) -> None:
-        input = """function test() public returns(address) {}"""
-        ast = parse(input)
-        self.assertIsNotNone(ast)
-        self.assertEqual(1, len(ast.children))
-        self.assertEqual("FunctionDefinition", ast.children[0].type)
-        self.assertEqual(1, len(ast.children[0].return_parameters))
-        self.assertEqual(
-            "VariableDeclaration", ast.children[0].return_parameters[0].type
+        return_parameter = self._return_parameter(
+            """function test() public returns(address) {}"""
         )
-        self.assertIsNone(ast.children[0].return_parameters[0].name)
-        self.assertIsNotNone(ast.children[0].return_parameters[0].type_name)
         self.assertEqual(
-            "ElementaryTypeName", ast.children[0].return_parameters[0].type_name.type
-        )
-        self.assertEqual("address", ast.children[0].return_parameters[0].type_name.name)
-        self.assertIsNone(
-            ast.children[0].return_parameters[0].type_name.state_mutability
+            {
+                "type": "VariableDeclaration",
+                "name": None,
+                "type_name_type": "ElementaryTypeName",
+                "type_name_name": "address",
+                "state_mutability": None,
+            },
+            self._snapshot(return_parameter),
         )
@@ -0,0 +1,19 @@
+import unittest
+import simplejson
+
+from sgp.ast_node_types import dumps
+from sgp.sgp_parser import parse
+
+
+class TestImportAliases(unittest.TestCase):
+    def test_symbol_aliases_serialize_as_nested_lists(self) -> None:
+        input = """import {A as B, C} from "./x.sol";"""
+
+        res = parse(input)
+        import_directive = res.to_json()["children"][0]
+        self.assertEqual([["A", "B"], ["C", None]], import_directive["symbolAliases"])
+        self.assertEqual(
+            "Identifier", import_directive["symbolAliasesIdentifiers"][1][0]["type"]
+        )
+        self.assertIsNone(import_directive["symbolAliasesIdentifiers"][1][1])
+        self.assertEqual(simplejson.dumps(res.to_json()), dumps(res))
@@ -0,0 +1,24 @@
+import unittest
+
+from sgp.ast_node_types import Location, Position
+
+
+class TestLocation(unittest.TestCase):
+    def test_position_is_immutable(self) -> None:
+        loc = Location(start=(1, 2), end=(3, 4))
+
+        with self.assertRaises(AttributeError):
+            loc.start.line = 5
+        self.assertEqual(1, loc.start.line)
+
+    def test_location_setters_write_back(self) -> None:
+        loc = Location(start=(1, 2), end=(3, 4))
+
+        loc.start = Position(5, 6)
+        loc.end_column = 7
+        self.assertEqual((5, 6), (loc.start.line, loc.start.column))
+        self.assertEqual((3, 7), (loc.end.line, loc.end.column))
+        self.assertEqual(
+            {"start": {"line": 5, "column": 6}, "end": {"line": 3, "column": 7}},
+            loc.to_json(),
+        )
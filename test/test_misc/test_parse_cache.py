@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sgp import sgp_parser
+from sgp.sgp_parser import parse
+
+
+class TestParseCache(unittest.TestCase):
+    def test_cached_parse_returns_independent_copies(self) -> None:
+        input = """contract X { function a() public pure {} }"""
+
+        first = parse(input, cache=True)
+        second = parse(input, cache=True)
+        self.assertIsNot(first, second)
+        self.assertEqual("X", second.children[0].name)
+
+        first.children[0].name = "Y"
+        self.assertEqual("X", parse(input, cache=True).children[0].name)
+
+    def test_cached_parse_is_reused_from_cache_dir(self) -> None:
+        input = """contract Z { function a() public pure {} }"""
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = parse(input, cache=True, cache_dir=cache_dir)
+            self.assertEqual(1, len(os.listdir(cache_dir)))
+
+            sgp_parser._parse_cache.clear()
+            with mock.patch.object(sgp_parser, "_parse", side_effect=AssertionError):
+                second = parse(input, cache=True, cache_dir=cache_dir)
+            self.assertEqual(first.to_json(), second.to_json())
+
+    def test_corrupt_cache_dir_entry_is_a_miss(self) -> None:
+        input = """contract W { function a() public pure {} }"""
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            parse(input, cache=True, cache_dir=cache_dir)
+            (file_name,) = os.listdir(cache_dir)
+            path = os.path.join(cache_dir, file_name)
+            with open(path, "r+b") as f:
+                f.truncate(10)
+
+            sgp_parser._parse_cache.clear()
+            ast = parse(input, cache=True, cache_dir=cache_dir)
+            self.assertEqual("W", ast.children[0].name)
+            # The truncated entry was replaced by the fresh parse
+            with open(path, "rb") as f:
+                self.assertGreater(len(f.read()), 10)
+
+    def test_cache_dir_entries_are_keyed_by_sgp_version(self) -> None:
+        versions = []
+        for sgp_version in ("1.0.0", "1.0.1"):
+            with mock.patch.object(sgp_parser, "_disk_cache_version", None):
+                with mock.patch("importlib.metadata.version", return_value=sgp_version):
+                    versions.append(sgp_parser._get_disk_cache_version())
+        self.assertNotEqual(versions[0], versions[1])
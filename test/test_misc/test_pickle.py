@@ -0,0 +1,24 @@
+import pickle
+import unittest
+
+from sgp.ast_node_types import Location, Position, Range
+from sgp.sgp_parser import parse
+
+
+class TestPickle(unittest.TestCase):
+    def test_ast_pickle_round_trip(self) -> None:
+        input = """import {A as B} from "./x.sol";
+contract X { uint a = 1; function b() public { a += 2; } }"""
+
+        res = parse(input)
+        self.assertEqual(res.to_json(), pickle.loads(pickle.dumps(res)).to_json())
+
+    def test_position_location_range_round_trip(self) -> None:
+        position = pickle.loads(pickle.dumps(Position(1, 2)))
+        self.assertEqual((1, 2), (position.line, position.column))
+
+        loc = pickle.loads(pickle.dumps(Location(start=(1, 2), end=(3, 4))))
+        self.assertEqual(Location(start=(1, 2), end=(3, 4)).to_json(), loc.to_json())
+
+        range = pickle.loads(pickle.dumps(Range(5, -1)))
+        self.assertEqual((5, -1), (range.offset_start, range.offset_end))
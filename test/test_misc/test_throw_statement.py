@@ -0,0 +1,13 @@
+import unittest
+
+from sgp.sgp_parser import parse
+
+
+class TestThrowStatement(unittest.TestCase):
+    def test_throw_statement(self) -> None:
+        input = """contract X { function f() public { throw; } }"""
+
+        res = parse(input)
+        statement = res.children[0].children[0].body.statements[0]
+        self.assertEqual("ThrowStatement", statement.type)
+        self.assertEqual("ThrowStatement", statement.to_json()["type"])
@@ -0,0 +1,31 @@
+import unittest
+
+from sgp.sgp_parser import parse
+from sgp.sgp_visitor import SGPVisitorOptions
+
+
+class TestTokens(unittest.TestCase):
+    def test_tokens_option_lists_source_tokens(self) -> None:
+        input = """contract X {}"""
+
+        res = parse(input, SGPVisitorOptions(tokens=True))
+        tokens = res.to_json()["tokens"]
+        self.assertEqual(
+            ["contract", "X", "{", "}"], [token["value"] for token in tokens]
+        )
+        self.assertEqual(
+            {
+                "type": "Identifier",
+                "value": "X",
+                "range": [9, 10],
+                "loc": {
+                    "start": {"line": 1, "column": 9},
+                    "end": {"line": 1, "column": 10},
+                },
+            },
+            tokens[1],
+        )
+
+    def test_tokens_are_not_serialized_by_default(self) -> None:
+        res = parse("""contract X {}""")
+        self.assertNotIn("tokens", res.to_json())
@@ -0,0 +1,36 @@
+import unittest
+from unittest import mock
+
+from antlr4.Token import CommonToken
+
+from sgp.parser.SolidityParser import SolidityParser as SP
+from sgp.sgp_visitor import (
+    SGPVisitor,
+    SGPVisitorOptions,
+    UnrecognizedExpressionError,
+)
+from sgp.sgp_parser import parse
+
+
+class TestUnrecognizedExpression(unittest.TestCase):
+    def test_unrecognized_expression_raises_dedicated_error(self) -> None:
+        ctx = SP.ExpressionContext(None)
+        for text in "a b c d e f g".split():
+            token = CommonToken()
+            token.text = text
+            ctx.addTokenNode(token)
+
+        with self.assertRaises(UnrecognizedExpressionError) as raised:
+            SGPVisitor(SGPVisitorOptions()).visitExpression(ctx)
+        self.assertIsInstance(raised.exception, ValueError)
+        self.assertIs(ctx, raised.exception.ctx)
+        self.assertEqual("Unrecognized expression: abcdefg", str(raised.exception))
+
+    def test_unrecognized_expression_reaches_parse_callers(self) -> None:
+        def visitExpression(self, ctx):
+            raise UnrecognizedExpressionError(ctx)
+
+        with mock.patch.object(SGPVisitor, "visitExpression", visitExpression):
+            with self.assertRaises(UnrecognizedExpressionError) as raised:
+                parse("contract X { uint a = 1 + 2; }")
+        self.assertEqual("Unrecognized expression: 1+2", str(raised.exception))
@@ -1,32 +1,26 @@
 import unittest
 import pathlib
-import os
 import simplejson
 
+from sgp.ast_node_types import dumps
 from sgp.sgp_parser import parse
-from sgp.utils import string_from_snake_to_camel_case
+
+# Read once when the module is imported, not per test run
+_HERE = pathlib.Path(__file__).resolve().parent
+_EXPECTED_AST = (_HERE / "result.json").read_text(encoding="utf-8")
+_TEST_CONTENT = (_HERE / "test.sol").read_text(encoding="utf-8")
 
 
 class TestParsing(unittest.TestCase):
     def test_parsing(self):
-        current_directory = pathlib.Path(__file__).parent.resolve()
-
-        ast_expected = ""
-        with open(os.path.join(current_directory, "result.json"), "r") as f:
-            ast_expected = f.read()
+        ast_expected = _EXPECTED_AST
         self.assertNotEqual(ast_expected, "")
 
-        test_content = ""
-        with open(os.path.join(current_directory, "test.sol"), "r") as f:
-            test_content = f.read()
+        test_content = _TEST_CONTENT
         self.assertNotEqual(test_content, "")
 
         res = parse(test_content, dump_json=True)
-        ast_actual = simplejson.dumps(
-            res,
-            default=lambda obj: {
-                string_from_snake_to_camel_case(k): v for k, v in obj.__dict__.items()
-            },
-        )
+        ast_actual = simplejson.dumps(res.to_json())
 
         self.assertEqual(ast_expected, ast_actual)
+        self.assertEqual(ast_expected, dumps(res))